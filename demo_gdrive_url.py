@@ -10,6 +10,8 @@ This demonstrates:
 
 import re
 
+_GDRIVE_RE = re.compile(r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)')
+
 
 def demonstrate_url_usage():
     """Demonstrate how to use the Google Drive URL."""
@@ -22,8 +24,7 @@ def demonstrate_url_usage():
     print("=" * 80)
 
     # Extract file ID
-    pattern = r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)'
-    match = re.search(pattern, gdrive_url)
+    match = _GDRIVE_RE.search(gdrive_url)
 
     if match:
         file_id = match.group(1)
@@ -73,12 +74,8 @@ all_detections = []
 
 for audio_chunk, start_time, end_time in audio_processor.process_in_chunks(
         audio_file, chunk_duration=60.0):
-    detections = detector.detect_in_waveform(audio_chunk)
-
-    # Adjust timestamps
-    for d in detections:
-        d['start_time'] += start_time
-        d['end_time'] += start_time
+    # Timestamps are shifted to the position of the chunk in the file
+    detections = detector.detect_in_waveform(audio_chunk, chunk_offset=start_time)
 
     all_detections.extend(detections)
 
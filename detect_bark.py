@@ -6,7 +6,7 @@ Analyze audio files to detect dog barks with timestamps.
 Supports multiple formats, long files, and Google Drive links.
 
 Usage:
-    python detect_bark.py <audio_file_or_url> [options]
+    python detect_bark.py <audio_file_or_url_or_directory> [options]
 
 Examples:
     # Local file
@@ -20,16 +20,41 @@ Examples:
 
     # Save results to JSON
     python detect_bark.py my_audio.mp3 --output results.json
+
+    # Every audio file in a directory (or a glob), in parallel processes
+    python detect_bark.py recordings/ --workers 4 --output results/
 """
 
 import argparse
+import concurrent.futures
+import glob
 import json
+import multiprocessing
 import sys
 import os
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Tuple
 import time
 
-from dog_bark_detector import DogBarkDetector, AudioProcessor, GDriveDownloader
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from dog_bark_detector import disable_gpu, utils
+
+# The detector package pulls in TensorFlow and librosa, so it is imported where
+# it is used; --help and argument errors return without loading it
+if TYPE_CHECKING:
+    from dog_bark_detector import DogBarkDetector, AudioProcessor, Detections
+
+
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.opus', '.wma')
+
+# Per-process components used by batch workers (see _init_worker)
+_DETECTOR = None
+_AUDIO_PROCESSOR = None
 
 
 def parse_arguments():
@@ -43,13 +68,14 @@ Examples:
   %(prog)s "https://drive.google.com/file/d/FILE_ID/view"
   %(prog)s audio.wav --confidence 0.4 --merge-gap 2.0
   %(prog)s long_audio.mp3 --chunk-size 120 --output results.json
+  %(prog)s recordings/ --workers 4 --output results/
         """
     )
 
     parser.add_argument(
         'input',
         type=str,
-        help='Audio file path or Google Drive URL'
+        help='Audio file path, Google Drive URL, directory or glob pattern'
     )
 
     parser.add_argument(
@@ -73,11 +99,19 @@ Examples:
         help='Chunk size for processing long files in seconds (default: 60)'
     )
 
+    parser.add_argument(
+        '--overlap',
+        type=float,
+        default=1.0,
+        help='Overlap between consecutive chunks in seconds (default: 1.0)'
+    )
+
     parser.add_argument(
         '-o', '--output',
         type=str,
         default=None,
-        help='Output file for results (JSON format)'
+        help='Output file for results (JSON format); a directory when '
+             'processing several files'
     )
 
     parser.add_argument(
@@ -86,12 +120,79 @@ Examples:
         help='Do not merge nearby detections'
     )
 
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=2,
+        help='Number of chunks to decode ahead of inference (0 disables, default: 2)'
+    )
+
+    parser.add_argument(
+        '-b', '--batch-size',
+        type=int,
+        default=4,
+        help='Number of chunks passed to the model in one call (default: 4)'
+    )
+
+    parser.add_argument(
+        '--silence-rms',
+        type=float,
+        default=0.0,
+        help='Skip audio whose frame RMS is below this level, e.g. 0.01 '
+             '(default: 0, disabled; quiet or distant barks may be skipped)'
+    )
+
+    parser.add_argument(
+        '--silence-entropy',
+        type=float,
+        default=None,
+        help='Skip frames whose normalized spectral entropy is above this '
+             '(noise, 0.0-1.0, default: disabled)'
+    )
+
+    parser.add_argument(
+        '--vad',
+        action='store_true',
+        help='Only analyze voice-active spans found with webrtcvad, up to '
+             '--chunk-size seconds each (requires webrtcvad)'
+    )
+
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=None,
+        help='Worker processes when processing several files '
+             '(default: half the CPU cores, 1 with --gpu)'
+    )
+
     parser.add_argument(
         '--gpu',
         action='store_true',
         help='Use GPU acceleration if available'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=['hub', 'tflite', 'onnx'],
+        default='hub',
+        help='Inference backend: TensorFlow Hub model, or an exported TFLite '
+             'or ONNX model for faster CPU inference (default: hub)'
+    )
+
+    parser.add_argument(
+        '--model-path',
+        type=str,
+        default=None,
+        help='Exported model file for --backend tflite/onnx'
+    )
+
+    parser.add_argument(
+        '--class-map',
+        type=str,
+        default=None,
+        help='yamnet_class_map.csv for --backend tflite/onnx'
+    )
+
     parser.add_argument(
         '--download-dir',
         type=str,
@@ -102,11 +203,38 @@ Examples:
     return parser.parse_args()
 
 
-def process_audio_file(file_path: str, detector: DogBarkDetector,
-                      audio_processor: AudioProcessor,
+def batch_chunks(chunks: Iterable, batch_size: int) -> Iterator[List]:
+    """
+    Group chunks into lists of up to ``batch_size`` items.
+
+    Args:
+        chunks: Iterable of chunks
+        batch_size: Maximum number of chunks per batch
+
+    Yields:
+        Lists of consecutive chunks (the last one may be shorter)
+    """
+    batch = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= max(1, batch_size):
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def process_audio_file(file_path: str, detector: 'DogBarkDetector',
+                      audio_processor: 'AudioProcessor',
                       chunk_size: float = 60.0,
+                      overlap: float = 1.0,
                       merge_gap: float = 1.0,
-                      no_merge: bool = False) -> List[Dict]:
+                      no_merge: bool = False,
+                      prefetch: int = 2,
+                      batch_size: int = 4,
+                      rms_threshold: float = 0.0,
+                      entropy_threshold: Optional[float] = None,
+                      vad: bool = False) -> 'Detections':
     """
     Process audio file and detect dog barks.
 
@@ -115,11 +243,20 @@ def process_audio_file(file_path: str, detector: DogBarkDetector,
         detector: Dog bark detector instance
         audio_processor: Audio processor instance
         chunk_size: Chunk size in seconds for processing
+        overlap: Overlap between consecutive chunks in seconds
         merge_gap: Gap for merging detections
         no_merge: If True, don't merge detections
+        prefetch: Number of chunks to decode ahead of inference (0 disables)
+        batch_size: Number of chunks passed to the model in one call
+        rms_threshold: Minimum frame RMS for audio to be analyzed (0 disables
+            the RMS check)
+        entropy_threshold: Maximum normalized spectral entropy for audio to be
+            analyzed (None = RMS only)
+        vad: If True, only analyze voice-active spans found with webrtcvad,
+            using chunk_size as the maximum span length
 
     Returns:
-        List of detection events
+        Detection events, kept as columns (see Detections)
     """
     print(f"\n{'='*80}")
     print(f"Processing: {file_path}")
@@ -128,84 +265,399 @@ def process_audio_file(file_path: str, detector: DogBarkDetector,
     # Get audio duration
     total_duration = audio_processor.get_audio_duration(file_path)
     print(f"Audio duration: {detector.format_timestamp(total_duration)}")
-    print(f"Processing in chunks of {chunk_size} seconds...\n")
 
     all_detections = []
+    chunk_starts = []
     chunk_count = 0
 
-    # Process in chunks
-    for audio_chunk, start_time, end_time in audio_processor.process_in_chunks(
-            file_path, chunk_duration=chunk_size, overlap=2.0):
+    if vad:
+        print(f"Processing voice-active spans of up to {chunk_size} seconds...\n")
+        chunks = audio_processor.iter_active_chunks(
+            file_path, max_chunk=chunk_size, total_duration=total_duration)
+        # Spans only overlap where a long one was split, and the later piece
+        # owns the shared padding
+        overlap = 0.0
+    else:
+        print(f"Processing in chunks of {chunk_size} seconds...\n")
+        # Chunk buffers are reused; enough are kept for a full batch, the prefetch
+        # queue, and the chunks being handed over and decoded by the producer
+        chunks = audio_processor.process_in_chunks(
+            file_path, chunk_duration=chunk_size, overlap=overlap,
+            total_duration=total_duration,
+            num_buffers=max(1, batch_size) + max(0, prefetch) + 2)
+    if prefetch > 0:
+        chunks = utils.prefetch(chunks, n=prefetch)
+
+    sample_rate = audio_processor.sample_rate
+    skipped_chunks = 0
+
+    # Process in batches of chunks (decoding of the next chunks overlaps with inference)
+    for batch in batch_chunks(chunks, batch_size):
+        # Only acoustically active regions of each chunk are sent to the model
+        segments = []
+        for chunk_idx, (audio_chunk, start_time, _) in enumerate(batch):
+            if rms_threshold > 0 or entropy_threshold is not None:
+                regions = audio_processor.find_active_regions(
+                    audio_chunk, rms_threshold=rms_threshold,
+                    entropy_threshold=entropy_threshold)
+            else:
+                regions = [(0, len(audio_chunk))]
+
+            for region_start, region_end in regions:
+                segments.append((chunk_idx, audio_chunk[region_start:region_end],
+                                 start_time + region_start / sample_rate))
+
+        # Detect in all active regions of the batch with a single model call
+        # (timestamps are shifted by each region's offset in the recording)
+        segment_detections = detector.detect_in_waveform_batch(
+            [waveform for _, waveform, _ in segments],
+            chunk_offsets=[offset for _, _, offset in segments])
+
+        chunk_detections = [[] for _ in batch]
+        chunk_has_audio = [False] * len(batch)
+        for (chunk_idx, _, _), detections in zip(segments, segment_detections):
+            chunk_has_audio[chunk_idx] = True
+            chunk_detections[chunk_idx].append(detector.detections_to_array(detections))
+
+        for (_, start_time, end_time), detections, has_audio in zip(
+                batch, chunk_detections, chunk_has_audio):
+            chunk_count += 1
+            print(f"Processing chunk {chunk_count}: "
+                  f"{detector.format_timestamp(start_time)} - "
+                  f"{detector.format_timestamp(end_time)}")
+
+            if not has_audio:
+                skipped_chunks += 1
+                print("  → Silent, skipped")
+
+            detections = np.concatenate(
+                detections or [np.empty(0, dtype=detector.DETECTION_DTYPE)])
+            all_detections.append(detections)
+            chunk_starts.append(start_time)
+
+            if len(detections):
+                print(f"  → Found {len(detections)} detection(s) in this chunk")
+
+    if skipped_chunks:
+        print(f"\nSkipped {skipped_chunks} silent chunk(s)")
+
+    all_detections = drop_overlap_duplicates(all_detections, chunk_starts, overlap)
+
+    # Merge nearby detections if requested
+    if not no_merge and len(all_detections):
+        print(f"\nMerging detections with gap threshold: {merge_gap}s")
+        original_count = len(all_detections)
+        all_detections = detector.merge_detections_vec(all_detections, merge_gap=merge_gap)
+        print(f"Merged {original_count} detections into {len(all_detections)} events")
+
+    return detector.array_to_detections(all_detections)
 
-        chunk_count += 1
-        print(f"Processing chunk {chunk_count}: "
-              f"{detector.format_timestamp(start_time)} - "
-              f"{detector.format_timestamp(end_time)}")
 
-        # Detect in current chunk
-        detections = detector.detect_in_waveform(audio_chunk)
+def drop_overlap_duplicates(chunk_detections: List[np.ndarray],
+                            chunk_starts: List[float],
+                            overlap: float) -> np.ndarray:
+    """
+    Combine per-chunk detections, keeping one copy of each overlapped frame.
 
-        # Adjust timestamps based on chunk offset
-        for detection in detections:
-            detection['start_time'] += start_time
-            detection['end_time'] += start_time
+    Each chunk owns the frames that start between the midpoints of its
+    overlaps with the previous and next chunks, so a frame seen by two
+    chunks is only reported by one of them.
 
-        all_detections.extend(detections)
+    Args:
+        chunk_detections: Structured detection arrays, one per chunk
+        chunk_starts: Start time of each chunk in seconds
+        overlap: Overlap between consecutive chunks in seconds
+
+    Returns:
+        Structured array of all kept detections
+    """
+    from dog_bark_detector import DogBarkDetector
 
-        if detections:
-            print(f"  → Found {len(detections)} detection(s) in this chunk")
+    kept = []
+    half_overlap = overlap / 2
 
-    # Merge nearby detections if requested
-    if not no_merge and all_detections:
-        print(f"\nMerging detections with gap threshold: {merge_gap}s")
-        original_count = len(all_detections)
-        all_detections = detector.merge_detections(all_detections, merge_gap=merge_gap)
-        print(f"Merged {original_count} detections into {len(all_detections)} events")
+    for idx, detections in enumerate(chunk_detections):
+        lower = chunk_starts[idx] + half_overlap if idx > 0 else -np.inf
+        upper = (chunk_starts[idx + 1] + half_overlap
+                 if idx + 1 < len(chunk_starts) else np.inf)
+        starts = detections['start_time']
+        kept.append(detections[(starts >= lower) & (starts < upper)])
 
-    return all_detections
+    return np.concatenate(kept) if kept else np.empty(0, dtype=DogBarkDetector.DETECTION_DTYPE)
 
 
-def save_results(detections: List[Dict], output_path: str, input_file: str):
+def find_input_files(input_path: str) -> Tuple[List[str], bool]:
+    """
+    Expand the CLI input into a list of files to process.
+
+    Existing paths are never treated as glob patterns, so file names that
+    contain '[', '*' or '?' are processed as given.
+
+    Args:
+        input_path: File path, Google Drive URL, directory or glob pattern
+
+    Returns:
+        Tuple of (files, batch). Directories and globs expand to the audio
+        files they contain (sorted) and are processed as a batch even when
+        they match a single file; anything else is returned as a single input
+    """
+    from dog_bark_detector import GDriveDownloader
+
+    if os.path.isdir(input_path):
+        return sorted(
+            os.path.join(input_path, name) for name in os.listdir(input_path)
+            if name.lower().endswith(AUDIO_EXTENSIONS)
+        ), True
+
+    if (not os.path.exists(input_path)
+            and not GDriveDownloader.is_gdrive_url(input_path)
+            and glob.has_magic(input_path)):
+        return sorted(path for path in glob.glob(input_path)
+                      if path.lower().endswith(AUDIO_EXTENSIONS)), True
+
+    return [input_path], False
+
+
+def detector_options(args: argparse.Namespace) -> Dict:
+    """
+    Build the DogBarkDetector keyword arguments from the command line.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Keyword arguments for DogBarkDetector
+    """
+    return {
+        'confidence_threshold': args.confidence,
+        'use_gpu': args.gpu,
+        'backend': args.backend,
+        'model_path': args.model_path,
+        'class_map_path': args.class_map
+    }
+
+
+def _init_worker(detector_kwargs: Dict):
+    """
+    Load the model once per worker process.
+
+    Args:
+        detector_kwargs: Keyword arguments for DogBarkDetector
+    """
+    from dog_bark_detector import DogBarkDetector, AudioProcessor
+
+    global _DETECTOR, _AUDIO_PROCESSOR
+    _DETECTOR = DogBarkDetector(**detector_kwargs)
+    _AUDIO_PROCESSOR = AudioProcessor(sample_rate=16000)
+
+
+def _process_file_in_worker(file_path: str, options: Dict) -> 'Detections':
+    """
+    Process one file with the worker's detector and print its detections.
+
+    Args:
+        file_path: Path to audio file
+        options: Keyword arguments for process_audio_file
+
+    Returns:
+        Detection events (pickled back to the parent as arrays)
+    """
+    detections = process_audio_file(file_path, _DETECTOR, _AUDIO_PROCESSOR, **options)
+    print(f"\nResults for {file_path}:")
+    _DETECTOR.print_detections(detections)
+    return detections
+
+
+def process_files_parallel(file_paths: List[str], options: Dict,
+                           detector_kwargs: Dict,
+                           workers: int) -> Dict[str, 'Detections']:
+    """
+    Process several files across worker processes, one model per worker.
+
+    Processes are spawned rather than forked because TensorFlow is not
+    fork-safe once it has been imported.
+
+    Args:
+        file_paths: Paths to audio files
+        options: Keyword arguments for process_audio_file
+        detector_kwargs: Keyword arguments for each worker's DogBarkDetector
+        workers: Number of worker processes
+
+    Returns:
+        Mapping of file path to its detection events (failed files are omitted)
+    """
+    results = {}
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(detector_kwargs,)) as executor:
+        futures = {
+            executor.submit(_process_file_in_worker, file_path, options): file_path
+            for file_path in file_paths
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            file_path = futures[future]
+            try:
+                results[file_path] = future.result()
+            except Exception as e:
+                print(f"\nError processing {file_path}: {str(e)}", file=sys.stderr)
+
+    return results
+
+
+def save_results(detections: 'Detections', output_path: str, input_file: str):
     """
     Save detection results to JSON file.
 
     Args:
-        detections: List of detection events
+        detections: Detections (or list of detection events)
         output_path: Output file path
         input_file: Input audio file path
     """
+    # The detections module does not import TensorFlow, so batch runs save
+    # results from the parent process without loading it
+    from dog_bark_detector.detections import (
+        _detection_class_names, _detection_columns, format_timestamps,
+        get_detection_summary)
+
+    # Records are built from the detection columns; dicts are only made for
+    # the JSON output
+    starts, ends, confidences = _detection_columns(detections)
+    durations = ends - starts
+
+    records = [
+        {
+            'event_number': idx,
+            'start_time': start,
+            'end_time': end,
+            'start_timestamp': start_timestamp,
+            'end_timestamp': end_timestamp,
+            'duration': duration,
+            'confidence': confidence,
+            'class_name': class_name
+        }
+        for idx, (start, end, start_timestamp, end_timestamp, duration, confidence,
+                  class_name) in enumerate(
+            zip(starts.tolist(), ends.tolist(),
+                format_timestamps(starts),
+                format_timestamps(ends), durations.tolist(),
+                confidences.tolist(), _detection_class_names(detections)), 1)
+    ]
+
     results = {
         'input_file': input_file,
         'total_detections': len(detections),
-        'detections': []
+        'detections': records
     }
 
-    detector = DogBarkDetector(confidence_threshold=0.0)  # Just for formatting
-
-    for idx, detection in enumerate(detections, 1):
-        results['detections'].append({
-            'event_number': idx,
-            'start_time': detection['start_time'],
-            'end_time': detection['end_time'],
-            'start_timestamp': detector.format_timestamp(detection['start_time']),
-            'end_timestamp': detector.format_timestamp(detection['end_time']),
-            'duration': detection['end_time'] - detection['start_time'],
-            'confidence': detection['confidence'],
-            'class_name': detection['class_name']
-        })
-
     # Add summary
     if detections:
-        summary = detector.get_detection_summary(detections)
+        summary = get_detection_summary(detections)
         results['summary'] = summary
 
-    # Save to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # Save to file (orjson is much faster and serializes NumPy values natively)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2
+                                 | orjson.OPT_SERIALIZE_NUMPY
+                                 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
 
     print(f"\nResults saved to: {output_path}")
 
 
+def process_single(input_path: str, options: Dict, args: argparse.Namespace):
+    """
+    Download (if needed), process and report a single input.
+
+    Args:
+        input_path: Audio file path or Google Drive URL
+        options: Keyword arguments for process_audio_file
+        args: Parsed command line arguments
+    """
+    from dog_bark_detector import DogBarkDetector, AudioProcessor, GDriveDownloader
+
+    # Handle Google Drive downloads
+    gdrive = GDriveDownloader()
+    input_file = gdrive.download_if_gdrive(input_path, args.download_dir)
+
+    # Check if file exists
+    if not os.path.exists(input_file):
+        print(f"Error: File not found: {input_file}")
+        sys.exit(1)
+
+    # Initialize detector
+    detector = DogBarkDetector(**detector_options(args))
+
+    # Initialize audio processor
+    audio_processor = AudioProcessor(sample_rate=16000)
+
+    # Process audio file
+    detections = process_audio_file(input_file, detector, audio_processor, **options)
+
+    # Print results
+    detector.print_detections(detections)
+
+    # Print summary
+    if detections:
+        summary = detector.get_detection_summary(detections)
+        print("Summary Statistics:")
+        print(f"  Total events: {summary['total_events']}")
+        print(f"  Total duration of barking: {summary['total_duration']:.2f} seconds")
+        print(f"  Average event duration: {summary['avg_duration']:.2f} seconds")
+        print(f"  Average confidence: {summary['avg_confidence']:.2%}")
+        print(f"  Confidence range: {summary['min_confidence']:.2%} - {summary['max_confidence']:.2%}")
+
+    # Save results if requested
+    if args.output:
+        save_results(detections, args.output, input_file)
+
+
+def process_batch(input_files: List[str], options: Dict, args: argparse.Namespace):
+    """
+    Process several local files in parallel and report per-file results.
+
+    Args:
+        input_files: Paths to audio files
+        options: Keyword arguments for process_audio_file
+        args: Parsed command line arguments
+    """
+    workers = args.workers or max(1, (os.cpu_count() or 2) // 2)
+    if args.gpu:
+        # Worker processes would compete for the same GPU
+        workers = 1
+    workers = min(workers, len(input_files))
+
+    print(f"Processing {len(input_files)} files with {workers} worker process(es)...")
+
+    results = process_files_parallel(input_files, options, detector_options(args),
+                                     workers)
+
+    print("\n" + "="*80)
+    print("Batch Processing Summary")
+    print("="*80)
+
+    for input_file in input_files:
+        if input_file in results:
+            print(f"  {input_file}: {len(results[input_file])} event(s)")
+        else:
+            print(f"  {input_file}: FAILED")
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        for input_file, detections in results.items():
+            name = os.path.splitext(os.path.basename(input_file))[0] + '.json'
+            save_results(detections, os.path.join(args.output, name), input_file)
+
+    if len(results) < len(input_files):
+        sys.exit(1)
+
+
 def main():
     """Main function."""
     args = parse_arguments()
@@ -215,6 +667,18 @@ def main():
         print("Error: Confidence threshold must be between 0.0 and 1.0")
         sys.exit(1)
 
+    if args.backend != 'hub' and (args.model_path is None or args.class_map is None):
+        print(f"Error: --backend {args.backend} requires --model-path and --class-map")
+        sys.exit(1)
+
+    if args.backend == 'onnx' and args.gpu:
+        print("Error: --backend onnx runs on the CPU only; drop --gpu")
+        sys.exit(1)
+
+    if not args.gpu:
+        # Must happen before TensorFlow is imported; workers inherit it
+        disable_gpu()
+
     try:
         start_time = time.time()
 
@@ -225,50 +689,29 @@ def main():
 
         print("Initializing components...")
 
-        # Handle Google Drive downloads
-        gdrive = GDriveDownloader()
-        input_file = gdrive.download_if_gdrive(args.input, args.download_dir)
-
-        # Check if file exists
-        if not os.path.exists(input_file):
-            print(f"Error: File not found: {input_file}")
+        options = {
+            'chunk_size': args.chunk_size,
+            'overlap': args.overlap,
+            'merge_gap': args.merge_gap,
+            'no_merge': args.no_merge,
+            'prefetch': args.prefetch,
+            'batch_size': args.batch_size,
+            'rms_threshold': args.silence_rms,
+            'entropy_threshold': args.silence_entropy,
+            'vad': args.vad
+        }
+
+        input_files, batch = find_input_files(args.input)
+        if not input_files:
+            print(f"Error: No audio files found in: {args.input}")
             sys.exit(1)
 
-        # Initialize detector
-        detector = DogBarkDetector(
-            confidence_threshold=args.confidence,
-            use_gpu=args.gpu
-        )
-
-        # Initialize audio processor
-        audio_processor = AudioProcessor(sample_rate=16000)
-
-        # Process audio file
-        detections = process_audio_file(
-            input_file,
-            detector,
-            audio_processor,
-            chunk_size=args.chunk_size,
-            merge_gap=args.merge_gap,
-            no_merge=args.no_merge
-        )
-
-        # Print results
-        detector.print_detections(detections)
-
-        # Print summary
-        if detections:
-            summary = detector.get_detection_summary(detections)
-            print("Summary Statistics:")
-            print(f"  Total events: {summary['total_events']}")
-            print(f"  Total duration of barking: {summary['total_duration']:.2f} seconds")
-            print(f"  Average event duration: {summary['avg_duration']:.2f} seconds")
-            print(f"  Average confidence: {summary['avg_confidence']:.2%}")
-            print(f"  Confidence range: {summary['min_confidence']:.2%} - {summary['max_confidence']:.2%}")
-
-        # Save results if requested
-        if args.output:
-            save_results(detections, args.output, input_file)
+        # Directories and globs keep batch output (--output is a directory)
+        # even when they contain a single file
+        if batch:
+            process_batch(input_files, options, args)
+        else:
+            process_single(input_files[0], options, args)
 
         elapsed_time = time.time() - start_time
         print(f"\nTotal processing time: {elapsed_time:.2f} seconds")
@@ -6,8 +6,27 @@ A high-performance audio analysis tool for detecting dog barks in audio files.
 __version__ = "1.0.0"
 __author__ = "Claude AI"
 
-from .detector import DogBarkDetector
-from .audio_processor import AudioProcessor
-from .gdrive_downloader import GDriveDownloader
+import importlib
 
-__all__ = ["DogBarkDetector", "AudioProcessor", "GDriveDownloader"]
+# Lightweight: lets callers hide the GPU before TensorFlow is first imported
+from ._tf_init import disable_gpu
+
+# Submodules are imported on first attribute access, so using one component
+# (e.g. GDriveDownloader) does not load TensorFlow or librosa
+_SUBMODULES = {
+    "DogBarkDetector": ".detector",
+    "Detections": ".detections",
+    "AudioProcessor": ".audio_processor",
+    "GDriveDownloader": ".gdrive_downloader",
+}
+
+__all__ = ["DogBarkDetector", "Detections", "AudioProcessor", "GDriveDownloader",
+           "disable_gpu"]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,87 @@
+"""
+Compiled kernels used by AudioProcessor and DogBarkDetector.
+
+Numba is installed with librosa; if it is unavailable the kernels fall back to
+equivalent NumPy expressions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba ships with librosa
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def abs_max(audio):
+        """Return the peak absolute value of a 1-D array in a single pass."""
+        peak = 0.0
+        for i in prange(audio.size):
+            peak = max(peak, abs(audio[i]))
+        return peak
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def scale_into(audio, factor, out):
+        """Write ``audio * factor`` into ``out``."""
+        for i in prange(audio.size):
+            out[i] = audio[i] * factor
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def noise_gate_into(audio, threshold, out):
+        """Write ``audio`` into ``out`` with samples below ``threshold`` attenuated 10x."""
+        for i in prange(audio.size):
+            sample = audio[i]
+            out[i] = sample * 0.1 if abs(sample) < threshold else sample
+
+    @njit(cache=True)
+    def merge_sorted(starts, ends, confidences, merge_gap):
+        """
+        Merge events sorted by start time in a single pass.
+
+        An event joins the current group when its start is within ``merge_gap``
+        of the furthest end in the group. Returns the index of each group's
+        first event, the group end times and the group maximum confidences.
+        """
+        group_starts = np.empty(starts.size, dtype=np.int64)
+        group_ends = np.empty(starts.size, dtype=np.float64)
+        group_confidences = np.empty(starts.size, dtype=np.float64)
+        count = 0
+        for i in range(starts.size):
+            if count == 0 or starts[i] - group_ends[count - 1] > merge_gap:
+                group_starts[count] = i
+                group_ends[count] = ends[i]
+                group_confidences[count] = confidences[i]
+                count += 1
+            else:
+                group_ends[count - 1] = max(group_ends[count - 1], ends[i])
+                group_confidences[count - 1] = max(group_confidences[count - 1],
+                                                   confidences[i])
+        return group_starts[:count], group_ends[:count], group_confidences[:count]
+
+else:
+
+    def abs_max(audio):
+        """Return the peak absolute value of a 1-D array."""
+        return float(np.abs(audio).max()) if audio.size else 0.0
+
+    def scale_into(audio, factor, out):
+        """Write ``audio * factor`` into ``out``."""
+        np.multiply(audio, factor, out=out)
+
+    def noise_gate_into(audio, threshold, out):
+        """Write ``audio`` into ``out`` with samples below ``threshold`` attenuated 10x."""
+        np.multiply(audio, np.where(np.abs(audio) < threshold, 0.1, 1.0), out=out)
+
+    def merge_sorted(starts, ends, confidences, merge_gap):
+        """Merge events sorted by start time (see the compiled version)."""
+        if starts.size == 0:
+            return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64),
+                    np.zeros(0, dtype=np.float64))
+        running_end = np.maximum.accumulate(ends)
+        gaps = starts[1:] - running_end[:-1]
+        group_starts = np.concatenate(([0], np.flatnonzero(gaps > merge_gap) + 1))
+        return (group_starts, np.maximum.reduceat(ends, group_starts),
+                np.maximum.reduceat(confidences, group_starts))
@@ -0,0 +1,28 @@
+"""
+TensorFlow start-up settings that only take effect before TensorFlow is imported.
+"""
+
+import os
+import sys
+
+
+def disable_gpu() -> bool:
+    """
+    Hide all GPUs from TensorFlow and silence its C++ start-up logging.
+
+    TensorFlow probes CUDA and cuDNN when it is imported, which costs seconds
+    and hundreds of MB of memory on CPU-only runs. Hiding the devices through
+    the environment skips the probe, but only if it happens before the import,
+    so call this before creating the first DogBarkDetector. The environment is
+    inherited by worker processes started afterwards.
+
+    Returns:
+        True if the settings apply, False if TensorFlow was already imported
+        (DogBarkDetector then hides the GPU with tf.config instead)
+    """
+    if 'tensorflow' in sys.modules:
+        return False
+
+    os.environ['CUDA_VISIBLE_DEVICES'] = ''
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+    return True
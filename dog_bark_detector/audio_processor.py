@@ -3,13 +3,30 @@ Audio processing utilities for handling various audio formats and large files.
 """
 
 import numpy as np
-import librosa
 import soundfile as sf
-from pydub import AudioSegment
-from typing import Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+import logging
+import subprocess
 import tempfile
 import os
 
+from . import _kernels
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_librosa():
+    """Import librosa on first use; it is only needed for resampling and fallbacks."""
+    import librosa
+    return librosa
+
+
+def _get_pydub():
+    """Import pydub's AudioSegment on first use; it is a last-resort decoder."""
+    from pydub import AudioSegment
+    return AudioSegment
+
 
 class AudioProcessor:
     """
@@ -17,14 +34,18 @@ class AudioProcessor:
     various formats and efficient handling of long audio files.
     """
 
-    def __init__(self, sample_rate: int = 16000):
+    def __init__(self, sample_rate: int = 16000, resample_type: str = 'soxr_qq'):
         """
         Initialize AudioProcessor.
 
         Args:
             sample_rate: Target sample rate for audio processing (default: 16000 Hz)
+            resample_type: librosa resampler used when the file rate differs
+                (default: 'soxr_qq', much faster than 'soxr_hq' and sufficient
+                for 16 kHz detection features)
         """
         self.sample_rate = sample_rate
+        self.resample_type = resample_type
 
     def load_audio(self, file_path: str, duration: Optional[float] = None,
                    offset: float = 0.0) -> Tuple[np.ndarray, int]:
@@ -43,19 +64,88 @@ class AudioProcessor:
 
         # For formats librosa handles well
         if file_ext in ['.wav', '.flac', '.ogg']:
-            audio, sr = librosa.load(file_path, sr=self.sample_rate,
-                                    duration=duration, offset=offset, mono=True)
+            # Already at the target rate: read directly, skipping librosa.
+            # libsndfile cannot read every such file (e.g. a mislabeled mp3);
+            # librosa below then falls back to its audioread decoder.
+            try:
+                info = sf.info(file_path)
+            except RuntimeError:
+                info = None
+            if info is not None and info.samplerate == self.sample_rate:
+                return self._load_with_soundfile(file_path, duration, offset), self.sample_rate
+
+            audio, sr = _get_librosa().load(file_path, sr=self.sample_rate,
+                                    duration=duration, offset=offset, mono=True,
+                                    res_type=self.resample_type)
             return audio, sr
 
-        # For other formats (mp3, m4a, etc.), use pydub first
+        # For other formats (mp3, m4a, etc.), decode straight to float32 with ffmpeg
         try:
-            audio, sr = librosa.load(file_path, sr=self.sample_rate,
-                                    duration=duration, offset=offset, mono=True)
+            return self._load_with_ffmpeg(file_path, duration, offset)
+        except (FileNotFoundError, RuntimeError):
+            pass
+
+        try:
+            audio, sr = _get_librosa().load(file_path, sr=self.sample_rate,
+                                    duration=duration, offset=offset, mono=True,
+                                    res_type=self.resample_type)
             return audio, sr
         except Exception as e:
             # Fallback to pydub for problematic formats
             return self._load_with_pydub(file_path, duration, offset)
 
+    def _load_with_soundfile(self, file_path: str, duration: Optional[float] = None,
+                             offset: float = 0.0) -> np.ndarray:
+        """
+        Read a file that is already at self.sample_rate straight into float32.
+
+        Args:
+            file_path: Path to audio file
+            duration: Duration to load in seconds
+            offset: Start time in seconds
+
+        Returns:
+            Mono audio data
+        """
+        start = int(np.round(offset * self.sample_rate))
+        frames = int(np.round(duration * self.sample_rate)) if duration is not None else -1
+
+        audio, _ = sf.read(file_path, start=start, frames=frames, dtype='float32',
+                           always_2d=False)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+
+        return audio
+
+    def _load_with_ffmpeg(self, file_path: str, duration: Optional[float] = None,
+                          offset: float = 0.0) -> Tuple[np.ndarray, int]:
+        """
+        Load audio by piping mono float32 PCM out of ffmpeg.
+
+        ffmpeg downmixes and resamples, so no int16 quantization or per-sample
+        Python conversion is involved.
+
+        Args:
+            file_path: Path to audio file
+            duration: Duration to load in seconds
+            offset: Start time in seconds
+
+        Returns:
+            Tuple of (audio_data, sample_rate)
+
+        Raises:
+            FileNotFoundError: If ffmpeg is not installed
+            RuntimeError: If ffmpeg fails to decode the file
+        """
+        block_samples = self.sample_rate * 60
+        # Blocks share one read buffer, so each is copied before the next read
+        blocks = [block.copy() for block in self._stream_ffmpeg(
+            file_path, block_samples, duration=duration, offset=offset)]
+        if not blocks:
+            return np.zeros(0, dtype=np.float32), self.sample_rate
+
+        return (blocks[0] if len(blocks) == 1 else np.concatenate(blocks)), self.sample_rate
+
     def _load_with_pydub(self, file_path: str, duration: Optional[float] = None,
                          offset: float = 0.0) -> Tuple[np.ndarray, int]:
         """
@@ -70,7 +160,7 @@ class AudioProcessor:
             Tuple of (audio_data, sample_rate)
         """
         # Load with pydub
-        audio_segment = AudioSegment.from_file(file_path)
+        audio_segment = _get_pydub().from_file(file_path)
 
         # Apply offset and duration
         start_ms = int(offset * 1000)
@@ -104,52 +194,454 @@ class AudioProcessor:
             # Try with soundfile first (fastest)
             info = sf.info(file_path)
             return info.duration
-        except:
-            # Fallback to librosa
-            try:
-                duration = librosa.get_duration(path=file_path)
-                return duration
-            except:
-                # Last resort: pydub
-                audio = AudioSegment.from_file(file_path)
-                return len(audio) / 1000.0
+        except Exception as e:
+            logger.debug("soundfile cannot read %s (%s), trying ffprobe", file_path, e)
+
+        try:
+            # ffprobe reads the container header without decoding the audio
+            output = subprocess.run(
+                ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                 '-of', 'default=nw=1:nk=1', file_path],
+                capture_output=True, text=True, check=True).stdout
+            return float(output.strip())
+        except (FileNotFoundError, subprocess.CalledProcessError, ValueError) as e:
+            logger.debug("ffprobe failed for %s (%s), falling back to librosa",
+                         file_path, e)
+
+        # Last resort: librosa (may decode the whole file)
+        return _get_librosa().get_duration(path=file_path)
 
     def process_in_chunks(self, file_path: str, chunk_duration: float = 60.0,
-                         overlap: float = 2.0):
+                         overlap: float = 2.0,
+                         total_duration: Optional[float] = None,
+                         num_buffers: int = 0):
         """
         Generator that yields audio chunks for efficient processing of long files.
 
+        The file is decoded once from start to end (see stream_chunks) rather
+        than re-opened and re-decoded for every chunk.
+
         Args:
             file_path: Path to audio file
             chunk_duration: Duration of each chunk in seconds
             overlap: Overlap between chunks in seconds
+            total_duration: Duration of the file if already known; only needed
+                when neither soundfile nor ffmpeg can stream it
+            num_buffers: Reuse a pool of this many chunk buffers instead of
+                allocating one per chunk (see stream_chunks)
 
         Yields:
             Tuple of (audio_chunk, start_time, end_time)
         """
-        total_duration = self.get_audio_duration(file_path)
-        offset = 0.0
+        chunk_samples = int(round(chunk_duration * self.sample_rate))
+        overlap_samples = int(round(overlap * self.sample_rate))
+        step = chunk_samples - overlap_samples
+
+        for idx, audio_chunk in enumerate(
+                self.stream_chunks(file_path, chunk_samples, overlap_samples,
+                                   total_duration=total_duration,
+                                   num_buffers=num_buffers)):
+            start_time = idx * step / self.sample_rate
+            end_time = start_time + len(audio_chunk) / self.sample_rate
+
+            yield audio_chunk, start_time, end_time
+
+    def iter_active_chunks(self, file_path: str, vad_aggressiveness: int = 2,
+                           pad: float = 0.5, max_chunk: float = 30.0,
+                           frame_ms: int = 30,
+                           total_duration: Optional[float] = None):
+        """
+        Generator that yields only the voice-active spans of a file.
 
-        while offset < total_duration:
-            # Calculate chunk duration (handle last chunk)
-            current_chunk_duration = min(chunk_duration, total_duration - offset)
+        The file is streamed once and every frame is classified with
+        webrtcvad; consecutive active frames are merged into spans, padded by
+        ``pad`` seconds on both sides. Spans longer than ``max_chunk`` are
+        split, with the next piece starting ``pad`` seconds before the split;
+        apart from these pieces, spans never overlap.
 
-            # Load chunk
-            audio_chunk, _ = self.load_audio(file_path,
-                                            duration=current_chunk_duration,
-                                            offset=offset)
+        Args:
+            file_path: Path to audio file
+            vad_aggressiveness: webrtcvad aggressiveness (0-3, 3 filters most)
+            pad: Context in seconds kept around active audio
+            max_chunk: Maximum chunk duration in seconds
+            frame_ms: VAD frame length in milliseconds (10, 20 or 30)
+            total_duration: Duration of the file if already known; only needed
+                when neither soundfile nor ffmpeg can stream it
+
+        Yields:
+            Tuple of (audio_chunk, start_time, end_time)
 
-            end_time = offset + current_chunk_duration
+        Raises:
+            ImportError: If webrtcvad is not installed
+            ValueError: If the sample rate or frame length is not supported,
+                or pad is not shorter than max_chunk
+        """
+        import webrtcvad
+
+        if self.sample_rate not in (8000, 16000, 32000, 48000):
+            raise ValueError(f"VAD does not support a sample rate of {self.sample_rate} Hz")
+        if frame_ms not in (10, 20, 30):
+            raise ValueError("VAD frame length must be 10, 20 or 30 ms")
+
+        vad = webrtcvad.Vad(vad_aggressiveness)
+        frame_len = self.sample_rate * frame_ms // 1000
+        pad_samples = int(pad * self.sample_rate)
+        max_samples = max(int(max_chunk * self.sample_rate), frame_len)
+        if pad_samples >= max_samples:
+            # A split chunk restarts pad before the split, so it would never advance
+            raise ValueError(f"VAD padding ({pad}s) must be shorter than "
+                             f"max_chunk ({max_chunk}s)")
+
+        # Decoded audio from absolute sample buffer_start onwards
+        buffer = np.zeros(0, dtype=np.float32)
+        buffer_start = 0
+        position = 0        # Next frame to classify
+        chunk_start = None  # Start of the open chunk, including padding
+        speech_end = 0      # End of the last active frame in the open chunk
+        closed_end = 0      # End of the last closed chunk; new chunks start after it
+
+        def emit(start, end):
+            audio = buffer[start - buffer_start:end - buffer_start].copy()
+            return audio, start / self.sample_rate, end / self.sample_rate
+
+        for block in self._stream_blocks(file_path, self.sample_rate, total_duration):
+            buffer = np.concatenate((buffer, block))
+
+            while position + frame_len <= buffer_start + len(buffer):
+                frame = buffer[position - buffer_start:position - buffer_start + frame_len]
+                pcm = (np.clip(frame, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+                if vad.is_speech(pcm, self.sample_rate):
+                    if chunk_start is None:
+                        chunk_start = max(position - pad_samples, closed_end)
+                    speech_end = position + frame_len
+                position += frame_len
+
+                if chunk_start is None:
+                    continue
+                if position - speech_end >= 2 * pad_samples:
+                    # Silence long enough to close the chunk with trailing padding
+                    closed_end = speech_end + pad_samples
+                    yield emit(chunk_start, closed_end)
+                    chunk_start = None
+                elif position - chunk_start >= max_samples:
+                    split = chunk_start + max_samples
+                    if speech_end + pad_samples <= split:
+                        # The speech and its padding end before the split
+                        closed_end = speech_end + pad_samples
+                        yield emit(chunk_start, closed_end)
+                        chunk_start = None
+                    else:
+                        yield emit(chunk_start, split)
+                        chunk_start = split - pad_samples
+
+            # Keep only the audio a future chunk can still include
+            keep_from = chunk_start if chunk_start is not None else position - pad_samples
+            keep_from = max(keep_from, buffer_start)
+            buffer = buffer[keep_from - buffer_start:]
+            buffer_start = keep_from
+
+        if chunk_start is not None:
+            yield emit(chunk_start, min(speech_end + pad_samples,
+                                        buffer_start + len(buffer)))
+
+    def stream_chunks(self, file_path: str, chunk_samples: int,
+                      overlap_samples: int,
+                      total_duration: Optional[float] = None,
+                      num_buffers: int = 0) -> Iterator[np.ndarray]:
+        """
+        Decode a file sequentially and yield overlapping windows of samples.
 
-            yield audio_chunk, offset, end_time
+        Uses a single soundfile handle when libsndfile can read the format, or
+        a single ffmpeg pipe otherwise, so each sample is decoded only once.
 
-            # Move to next chunk with overlap
-            offset += chunk_duration - overlap
+        With ``num_buffers > 0`` windows are written into a rotating pool of
+        preallocated buffers, so a window is overwritten ``num_buffers`` windows
+        later; callers must not hold more than ``num_buffers - 1`` windows
+        while requesting the next one.
 
-            # Stop if we've reached the end
-            if offset >= total_duration:
+        Args:
+            file_path: Path to audio file
+            chunk_samples: Number of samples per window
+            overlap_samples: Number of samples shared by consecutive windows
+            total_duration: Duration of the file if already known
+            num_buffers: Size of the reusable buffer pool (0 = new array per window)
+
+        Yields:
+            Mono float32 windows at self.sample_rate (the last may be shorter)
+        """
+        if not 0 <= overlap_samples < chunk_samples:
+            raise ValueError("Overlap must be non-negative and shorter than the chunk")
+
+        step = chunk_samples - overlap_samples
+        pool = [np.empty(chunk_samples, dtype=np.float32) for _ in range(num_buffers)]
+        blocks = self._stream_blocks(file_path, step, total_duration)
+        block = np.zeros(0, dtype=np.float32)
+        position = 0
+        previous = None
+        idx = 0
+
+        while True:
+            window = pool[idx % num_buffers] if pool else np.empty(chunk_samples,
+                                                                   dtype=np.float32)
+            filled = 0
+
+            # Carry the overlap over from the previous window
+            if previous is not None:
+                window[:overlap_samples] = previous[step:]
+                filled = overlap_samples
+
+            # Fill the rest from decoded blocks
+            while filled < chunk_samples:
+                if position == len(block):
+                    block = next(blocks, None)
+                    position = 0
+                    if block is None:
+                        break
+                    continue
+
+                count = min(chunk_samples - filled, len(block) - position)
+                window[filled:filled + count] = block[position:position + count]
+                filled += count
+                position += count
+
+            if filled < chunk_samples:
+                # End of file: emit the remainder only if it holds new samples
+                if filled > (overlap_samples if previous is not None else 0):
+                    yield window[:filled]
+                return
+
+            yield window
+            previous = window
+            idx += 1
+
+    def _stream_blocks(self, file_path: str, block_samples: int,
+                       total_duration: Optional[float] = None) -> Iterator[np.ndarray]:
+        """
+        Yield consecutive mono float32 blocks of a file at self.sample_rate.
+
+        Args:
+            file_path: Path to audio file
+            block_samples: Approximate number of output samples per block
+            total_duration: Duration of the file if already known
+
+        Yields:
+            Blocks of decoded audio
+        """
+        try:
+            sound_file = sf.SoundFile(file_path)
+        except RuntimeError:
+            sound_file = None
+
+        if sound_file is not None:
+            with sound_file:
+                yield from self._stream_soundfile(sound_file, block_samples)
+            return
+
+        streamed = False
+        try:
+            for block in self._stream_ffmpeg(file_path, block_samples):
+                streamed = True
+                yield block
+            return
+        except FileNotFoundError:
+            # No ffmpeg binary
+            pass
+        except RuntimeError as e:
+            # ffmpeg cannot decode the file; load_audio also tries librosa and
+            # pydub. Blocks already handed out cannot be taken back.
+            if streamed:
+                raise
+            logger.debug("ffmpeg failed for %s (%s), falling back to load_audio",
+                         file_path, e)
+
+        # Decode consecutive blocks with load_audio
+        if total_duration is None:
+            total_duration = self.get_audio_duration(file_path)
+        block_duration = block_samples / self.sample_rate
+        offset = 0.0
+        while offset < total_duration:
+            block, _ = self.load_audio(file_path, duration=block_duration,
+                                       offset=offset)
+            yield block.astype(np.float32, copy=False)
+            offset += block_duration
+
+    def _stream_soundfile(self, sound_file: sf.SoundFile,
+                          block_samples: int) -> Iterator[np.ndarray]:
+        """
+        Yield mono float32 blocks from an open soundfile handle, resampling
+        with a streaming soxr resampler when the file rate differs.
+
+        Args:
+            sound_file: Open soundfile handle
+            block_samples: Approximate number of output samples per block
+
+        Yields:
+            Blocks of decoded audio, valid until the next block is requested
+        """
+        resampler = None
+        read_frames = block_samples
+        if sound_file.samplerate != self.sample_rate:
+            import soxr
+            # Use the soxr quality matching resample_type ('soxr_qq' -> 'QQ')
+            quality = (self.resample_type[len('soxr_'):].upper()
+                       if self.resample_type.startswith('soxr_') else 'HQ')
+            resampler = soxr.ResampleStream(sound_file.samplerate, self.sample_rate,
+                                            1, dtype='float32', quality=quality)
+            read_frames = int(np.ceil(block_samples * sound_file.samplerate
+                                      / self.sample_rate))
+
+        # Reads go into one reused buffer instead of a new array per block
+        read_buffer = np.empty((read_frames, sound_file.channels), dtype=np.float32)
+
+        while True:
+            block = sound_file.read(read_frames, dtype='float32', always_2d=True,
+                                    out=read_buffer)
+            if len(block) == 0:
                 break
 
+            block = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+
+            if resampler is not None:
+                block = resampler.resample_chunk(block)
+            yield block
+
+        if resampler is not None:
+            yield resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+
+    def _stream_ffmpeg(self, file_path: str, block_samples: int,
+                       duration: Optional[float] = None,
+                       offset: float = 0.0) -> Iterator[np.ndarray]:
+        """
+        Yield mono float32 blocks decoded and resampled by a single ffmpeg process.
+
+        Args:
+            file_path: Path to audio file
+            block_samples: Number of output samples per block
+            duration: Duration to decode in seconds (None = until the end)
+            offset: Start time in seconds
+
+        Yields:
+            Blocks of decoded audio, valid until the next block is requested
+
+        Raises:
+            FileNotFoundError: If ffmpeg is not installed
+            RuntimeError: If ffmpeg fails to decode the file
+        """
+        command = ['ffmpeg', '-nostdin', '-v', 'error']
+        if offset:
+            command += ['-ss', str(offset)]
+        command += ['-i', file_path]
+        if duration is not None:
+            command += ['-t', str(duration)]
+        command += ['-f', 'f32le', '-ac', '1', '-ar', str(self.sample_rate), '-']
+        # Reads go into one reused buffer instead of a new bytes object per block
+        read_buffer = np.empty(block_samples, dtype=np.float32)
+        read_view = memoryview(read_buffer).cast('B')
+
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+            try:
+                while True:
+                    num_bytes = process.stdout.readinto(read_view)
+                    if not num_bytes:
+                        break
+                    # Drop a trailing partial sample if the stream was cut short
+                    yield read_buffer[:num_bytes // 4]
+
+                if process.wait() != 0:
+                    stderr.seek(0)
+                    error = stderr.read().decode('utf-8', errors='replace').strip()
+                    raise RuntimeError(f"ffmpeg failed to decode {file_path}: {error}")
+            finally:
+                process.stdout.close()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+    def find_active_regions(self, audio: np.ndarray, frame_ms: float = 32.0,
+                            rms_threshold: float = 0.01,
+                            entropy_threshold: Optional[float] = None,
+                            padding: float = 0.5) -> List[Tuple[int, int]]:
+        """
+        Find acoustically active regions so silent audio can skip inference.
+
+        The audio is split into non-overlapping frames; a frame is active when
+        its RMS reaches ``rms_threshold`` and, if ``entropy_threshold`` is set,
+        its normalized spectral entropy (0 = pure tone, 1 = flat spectrum) does
+        not exceed it. Active frames are padded and merged into regions.
+
+        Args:
+            audio: Audio data
+            frame_ms: Frame length in milliseconds
+            rms_threshold: Minimum frame RMS to count as active
+            entropy_threshold: Maximum normalized spectral entropy (None = ignore)
+            padding: Context in seconds kept around active frames
+
+        Returns:
+            List of (start_sample, end_sample) intervals, sorted and non-overlapping
+        """
+        frame_len = max(1, int(self.sample_rate * frame_ms / 1000))
+        num_full = len(audio) // frame_len
+
+        # Non-overlapping frames are a zero-copy reshape; the tail is handled apart
+        frames = [audio[:num_full * frame_len].reshape(num_full, frame_len)]
+        if len(audio) > num_full * frame_len:
+            tail = np.zeros((1, frame_len), dtype=audio.dtype)
+            tail[0, :len(audio) - num_full * frame_len] = audio[num_full * frame_len:]
+            frames.append(tail)
+
+        active = np.concatenate([
+            self._active_frames(f, rms_threshold, entropy_threshold) for f in frames
+        ])
+
+        if not active.any():
+            return []
+
+        # Run boundaries of active frames
+        edges = np.diff(np.concatenate(([0], active.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1) * frame_len
+        ends = np.flatnonzero(edges == -1) * frame_len
+
+        pad = int(padding * self.sample_rate)
+        starts = np.maximum(starts - pad, 0)
+        ends = np.minimum(ends + pad, len(audio))
+
+        # Merge regions that overlap after padding
+        regions = [(int(starts[0]), int(ends[0]))]
+        for start, end in zip(starts[1:], ends[1:]):
+            if start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], int(end))
+            else:
+                regions.append((int(start), int(end)))
+
+        return regions
+
+    @staticmethod
+    def _active_frames(frames: np.ndarray, rms_threshold: float,
+                       entropy_threshold: Optional[float]) -> np.ndarray:
+        """
+        Compute the activity mask for a 2-D array of frames.
+
+        Args:
+            frames: Array of shape (num_frames, frame_len)
+            rms_threshold: Minimum frame RMS to count as active
+            entropy_threshold: Maximum normalized spectral entropy (None = ignore)
+
+        Returns:
+            Boolean array of shape (num_frames,)
+        """
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        active = rms >= rms_threshold
+
+        if entropy_threshold is not None and active.any():
+            spectrum = np.abs(np.fft.rfft(frames[active], axis=1))
+            p = spectrum / (spectrum.sum(axis=1, keepdims=True) + 1e-12)
+            entropy = -np.sum(p * np.log(p + 1e-12), axis=1) / np.log(p.shape[1])
+            active[active] = entropy <= entropy_threshold
+
+        return active
+
     def normalize_audio(self, audio: np.ndarray) -> np.ndarray:
         """
         Normalize audio to [-1, 1] range.
@@ -160,31 +652,60 @@ class AudioProcessor:
         Returns:
             Normalized audio data
         """
-        max_val = np.abs(audio).max()
+        samples = self._as_float_samples(audio)
+        max_val = _kernels.abs_max(samples)
         if max_val > 0:
-            return audio / max_val
+            normalized = np.empty_like(samples)
+            _kernels.scale_into(samples, 1.0 / max_val, normalized)
+            return normalized.reshape(np.shape(audio))
         return audio
 
     def apply_noise_reduction(self, audio: np.ndarray,
-                             noise_threshold: float = 0.02) -> np.ndarray:
+                             noise_threshold: float = 0.02,
+                             inplace: bool = False) -> np.ndarray:
         """
         Simple noise reduction by removing low-amplitude samples.
 
         Args:
             audio: Audio data
             noise_threshold: Threshold below which to reduce signal
+            inplace: Overwrite ``audio`` instead of allocating a new array
+                (only possible for writable, contiguous float arrays)
 
         Returns:
             Audio with reduced noise
         """
-        # Create a copy
-        cleaned = audio.copy()
+        samples = self._as_float_samples(audio)
+
+        # Apply noise gate in a single pass, into the input itself if allowed
+        if inplace and samples.flags.writeable and np.shares_memory(samples, audio):
+            cleaned = samples
+        else:
+            cleaned = np.empty_like(samples)
+        _kernels.noise_gate_into(samples, noise_threshold, cleaned)
+
+        return cleaned.reshape(np.shape(audio))
+
+    @staticmethod
+    def _as_float_samples(audio: np.ndarray) -> np.ndarray:
+        """
+        Return audio as a flat, contiguous floating-point array for the kernels.
 
-        # Apply noise gate
-        mask = np.abs(cleaned) < noise_threshold
-        cleaned[mask] = cleaned[mask] * 0.1
+        Integer audio becomes float64, the dtype plain division gives it;
+        float16 is widened to float32 and other float dtypes are kept.
 
-        return cleaned
+        Args:
+            audio: Audio data
+
+        Returns:
+            1-D view of the audio (a copy only if a dtype/layout change is needed)
+        """
+        dtype = np.asarray(audio).dtype
+        if np.issubdtype(dtype, np.floating):
+            dtype = np.result_type(dtype, np.float32)
+        else:
+            dtype = np.float64
+        return np.ascontiguousarray(audio, dtype=dtype).reshape(-1)
 
     @staticmethod
     def convert_to_wav(input_file: str, output_file: Optional[str] = None) -> str:
@@ -203,7 +724,7 @@ class AudioProcessor:
             temp_fd, output_file = tempfile.mkstemp(suffix='.wav')
             os.close(temp_fd)
 
-        audio = AudioSegment.from_file(input_file)
+        audio = _get_pydub().from_file(input_file)
         audio.export(output_file, format='wav')
 
         return output_file
@@ -0,0 +1,251 @@
+"""
+Alternative YAMNet inference backends for CPU deployment.
+
+The default backend runs the TensorFlow Hub SavedModel (see DogBarkDetector).
+The backends here run an exported copy of the same network and return the
+per-frame class scores as a NumPy array.
+"""
+
+import csv
+import os
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+try:
+    # The standalone runtime is much smaller than TensorFlow when installed
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    Interpreter = None
+
+
+# YAMNet framing at 16kHz (see DogBarkDetector)
+PATCH_HOP_SAMPLES = 7680
+PATCH_SAMPLES = 15600
+
+
+def frame_waveform(waveform: np.ndarray) -> np.ndarray:
+    """
+    Split a waveform into the 0.96s patches YAMNet scores.
+
+    The waveform is zero padded at the end, so the patches match the frames
+    the full model produces for the same waveform.
+
+    Args:
+        waveform: 16kHz mono float32 waveform
+
+    Returns:
+        Array of shape (num_frames, PATCH_SAMPLES)
+    """
+    num_frames = 1 + max(0, -(-(len(waveform) - PATCH_SAMPLES) // PATCH_HOP_SAMPLES))
+    padded = np.zeros((num_frames - 1) * PATCH_HOP_SAMPLES + PATCH_SAMPLES,
+                      dtype=np.float32)
+    padded[:len(waveform)] = waveform
+    return np.lib.stride_tricks.sliding_window_view(
+        padded, PATCH_SAMPLES)[::PATCH_HOP_SAMPLES]
+
+
+def load_class_map(class_map_path: str) -> List[str]:
+    """
+    Read class names from a YAMNet class map CSV file.
+
+    Args:
+        class_map_path: Path to yamnet_class_map.csv
+
+    Returns:
+        List of class names in score column order
+
+    Raises:
+        ValueError: If there is no display_name column or a row is too short
+    """
+    with open(class_map_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if 'display_name' not in header:
+            raise ValueError(f"{class_map_path} has no display_name column")
+        name_col = header.index('display_name')
+
+        try:
+            return [row[name_col] for row in reader]
+        except IndexError:
+            raise ValueError(f"Malformed row at line {reader.line_num} "
+                             f"of {class_map_path}") from None
+
+
+class TFLiteYamnet:
+    """
+    YAMNet scores from a TFLite model (e.g. one made by convert_to_tflite).
+
+    The model takes a single 0.96s patch per invocation, so waveforms are
+    framed like the full model and scored patch by patch.
+    """
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None):
+        """
+        Load a TFLite model.
+
+        Args:
+            model_path: Path to the .tflite file
+            num_threads: Number of CPU threads for the interpreter (None = default)
+        """
+        interpreter_class = Interpreter
+        if interpreter_class is None:
+            import tensorflow as tf
+            interpreter_class = tf.lite.Interpreter
+
+        self.interpreter = interpreter_class(model_path=model_path,
+                                             num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self._input_index = input_details['index']
+        self._input_shape = input_details['shape']
+        self._output_index = output_details['index']
+        # Fully int8 models report quantized scores
+        self._output_quantization = output_details['quantization']
+
+    def __call__(self, waveform: np.ndarray) -> np.ndarray:
+        """
+        Score a waveform.
+
+        Args:
+            waveform: 16kHz mono float32 waveform
+
+        Returns:
+            Scores of shape (num_frames, num_classes)
+        """
+        scores = []
+        for patch in frame_waveform(waveform):
+            self.interpreter.set_tensor(self._input_index,
+                                        patch.reshape(self._input_shape))
+            self.interpreter.invoke()
+            output = self.interpreter.get_tensor(self._output_index)
+            scores.append(output.reshape(-1, output.shape[-1])[-1])
+
+        scores = np.stack(scores)
+        scale, zero_point = self._output_quantization
+        if scale:
+            scores = (scores.astype(np.float32) - zero_point) * scale
+        return scores
+
+
+class OnnxYamnet:
+    """
+    YAMNet scores from an ONNX model run by ONNX Runtime on the CPU.
+
+    Export the hub model with tf2onnx, e.g.
+    ``python -m tf2onnx.convert --saved-model <yamnet dir> --output yamnet.onnx``.
+    Models taking the whole waveform are scored in one run; models exported
+    with a fixed 0.96s patch input are scored patch by patch.
+    """
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None):
+        """
+        Create an ONNX Runtime session.
+
+        Only the CPU execution provider is used: for a network as small as
+        YAMNet the CUDA provider is slower than the CPU because of transfer
+        and launch overhead.
+
+        Args:
+            model_path: Path to the .onnx file
+            num_threads: Number of intra-op threads (None = all CPU cores)
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or os.cpu_count() or 0
+        self.session = ort.InferenceSession(model_path, sess_options=options,
+                                            providers=['CPUExecutionProvider'])
+
+        model_input = self.session.get_inputs()[0]
+        self._input_name = model_input.name
+        # Only the scores output is computed; embeddings are not needed
+        self._output_names = [self.session.get_outputs()[0].name]
+        self._patch_shape = None
+        if model_input.shape and model_input.shape[-1] == PATCH_SAMPLES:
+            self._patch_shape = [dim if isinstance(dim, int) else 1
+                                 for dim in model_input.shape]
+
+    def __call__(self, waveform: np.ndarray) -> np.ndarray:
+        """
+        Score a waveform.
+
+        Args:
+            waveform: 16kHz mono float32 waveform
+
+        Returns:
+            Scores of shape (num_frames, num_classes)
+        """
+        if self._patch_shape is None:
+            scores, = self.session.run(self._output_names, {self._input_name: waveform})
+            return scores
+
+        scores = []
+        for patch in frame_waveform(waveform):
+            output, = self.session.run(
+                self._output_names, {self._input_name: patch.reshape(self._patch_shape)})
+            scores.append(output.reshape(-1, output.shape[-1])[-1])
+        return np.stack(scores)
+
+
+# Backend name -> scorer class, for models exported from the hub model
+EXPORTED_BACKENDS = {
+    'tflite': TFLiteYamnet,
+    'onnx': OnnxYamnet,
+}
+
+
+def convert_to_tflite(output_path: str,
+                      model_url: str = 'https://tfhub.dev/google/yamnet/1',
+                      quantization: Optional[str] = 'float16',
+                      representative_waveforms: Optional[Iterable[np.ndarray]] = None) -> str:
+    """
+    Export YAMNet from TensorFlow Hub to a TFLite model for TFLiteYamnet.
+
+    Args:
+        output_path: Path of the .tflite file to write
+        model_url: URL to YAMNet model on TensorFlow Hub
+        quantization: 'float16' (half-size weights), 'int8' (integer kernels,
+            needs representative_waveforms) or None (float32)
+        representative_waveforms: 16kHz waveforms used to calibrate int8
+            activation ranges
+
+    Returns:
+        Path to the written model
+    """
+    import tensorflow as tf
+    import tensorflow_hub as hub
+
+    if quantization not in (None, 'float16', 'int8'):
+        raise ValueError(f"Unknown quantization: {quantization}")
+    if quantization == 'int8' and representative_waveforms is None:
+        raise ValueError("int8 quantization needs representative_waveforms")
+
+    model = hub.load(model_url)
+
+    @tf.function(input_signature=[tf.TensorSpec([PATCH_SAMPLES], tf.float32)])
+    def scores_fn(waveform):
+        scores, _, _ = model(waveform)
+        return scores
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions(
+        [scores_fn.get_concrete_function()], model)
+
+    if quantization is not None:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'int8':
+        def representative_dataset():
+            for waveform in representative_waveforms:
+                for patch in frame_waveform(np.asarray(waveform, dtype=np.float32)):
+                    yield [np.ascontiguousarray(patch)]
+
+        converter.representative_dataset = representative_dataset
+
+    with open(output_path, 'wb') as f:
+        f.write(converter.convert())
+
+    return output_path
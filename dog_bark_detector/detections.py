@@ -0,0 +1,169 @@
+"""
+Detection events and their formatting helpers.
+
+This module only needs NumPy, so results can be summarized and saved (e.g. by
+the parent process of a batch run) without loading TensorFlow.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+@dataclass(eq=False)
+class Detections:
+    """
+    Detection events held as parallel arrays (structure of arrays).
+
+    This is what detect_in_waveform returns. It behaves like the list of
+    detection dicts it replaces: len(), iteration and indexing all work.
+    The dicts are only built on first access and then kept, so changes made
+    to them persist.
+    """
+    starts: np.ndarray
+    ends: np.ndarray
+    confidences: np.ndarray
+    # -1 where no dog class scored above zero
+    class_indices: np.ndarray
+    class_names: List[str]
+    _dicts: Optional[List[Dict]] = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(self.to_dicts())
+
+    def __getitem__(self, index):
+        return self.to_dicts()[index]
+
+    def to_dicts(self) -> List[Dict]:
+        """
+        Get the detection events as dicts.
+
+        Returns:
+            List of detection events with timestamps and confidence scores
+        """
+        if self._dicts is None:
+            self._dicts = [
+                {
+                    'start_time': start_time,
+                    'end_time': end_time,
+                    'confidence': confidence,
+                    'class_name': self.class_names[class_idx] if class_idx >= 0 else None,
+                    'class_index': class_idx if class_idx >= 0 else None
+                }
+                for start_time, end_time, confidence, class_idx in zip(
+                    self.starts.tolist(), self.ends.tolist(),
+                    self.confidences.tolist(), self.class_indices.tolist())
+            ]
+        return self._dicts
+
+
+def _detection_columns(detections: Union[Detections, List[Dict]]) -> Tuple[np.ndarray, ...]:
+    """
+    Get start, end and confidence arrays of detection events.
+
+    Detections are read from their arrays unless their dicts were handed
+    out, since those may have been changed.
+
+    Args:
+        detections: Detections or list of detection events
+
+    Returns:
+        Tuple of (starts, ends, confidences) float64 arrays
+    """
+    if isinstance(detections, Detections) and detections._dicts is None:
+        return (detections.starts.astype(np.float64, copy=False),
+                detections.ends.astype(np.float64, copy=False),
+                detections.confidences.astype(np.float64, copy=False))
+
+    return (np.array([d['start_time'] for d in detections], dtype=np.float64),
+            np.array([d['end_time'] for d in detections], dtype=np.float64),
+            np.array([d['confidence'] for d in detections], dtype=np.float64))
+
+
+def _detection_class_names(detections: Union[Detections, List[Dict]]) -> List[Optional[str]]:
+    """
+    Get the class name of each detection event.
+
+    Like _detection_columns, names come from the class indices unless the
+    dicts were handed out.
+
+    Args:
+        detections: Detections or list of detection events
+
+    Returns:
+        Class name per event (None where no dog class scored above zero)
+    """
+    if isinstance(detections, Detections) and detections._dicts is None:
+        return [detections.class_names[idx] if idx >= 0 else None
+                for idx in detections.class_indices.tolist()]
+    return [d['class_name'] for d in detections]
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    Format seconds as HH:MM:SS.mmm
+
+    Args:
+        seconds: Time in seconds
+
+    Returns:
+        Formatted timestamp string
+    """
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+
+
+def format_timestamps(seconds: np.ndarray) -> List[str]:
+    """
+    Format an array of seconds as HH:MM:SS.mmm strings.
+
+    Args:
+        seconds: Times in seconds
+
+    Returns:
+        Formatted timestamp strings (see format_timestamp)
+    """
+    minutes, secs = np.divmod(np.asarray(seconds, dtype=np.float64), 60)
+    hours, minutes = np.divmod(minutes.astype(np.int64), 60)
+
+    # One %-format per timestamp on plain Python values (np.char.mod is slower)
+    return ['%02d:%02d:%06.3f' % fields
+            for fields in zip(hours.tolist(), minutes.tolist(), secs.tolist())]
+
+
+def get_detection_summary(detections: Union[Detections, List[Dict]]) -> Dict:
+    """
+    Get summary statistics of detections.
+
+    Args:
+        detections: Detections or list of detection events
+
+    Returns:
+        Dictionary with summary statistics
+    """
+    if not detections:
+        return {
+            'total_events': 0,
+            'total_duration': 0.0,
+            'avg_confidence': 0.0,
+            'max_confidence': 0.0,
+            'min_confidence': 0.0
+        }
+
+    starts, ends, confidences = _detection_columns(detections)
+    durations = ends - starts
+
+    return {
+        'total_events': len(detections),
+        'total_duration': float(durations.sum()),
+        'avg_duration': float(durations.mean()),
+        'avg_confidence': float(confidences.mean()),
+        'max_confidence': float(confidences.max()),
+        'min_confidence': float(confidences.min())
+    }
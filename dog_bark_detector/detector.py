@@ -1,13 +1,157 @@
 """
 Dog bark detection using YAMNet pre-trained model from TensorFlow Hub.
+
+TensorFlow and TensorFlow Hub are only imported by the 'hub' backend, so the
+exported TFLite/ONNX backends run without them.
 """
 
 import numpy as np
-import tensorflow as tf
-import tensorflow_hub as hub
-from typing import List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional, Union
 import csv
-import io
+import functools
+import hashlib
+import json
+import os
+import re
+
+from . import _kernels
+from . import backends
+from . import detections as _detections
+from .detections import Detections, _detection_class_names, _detection_columns
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+
+# Parsed class maps and dog class indices are kept here between runs
+CLASS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dog_bark_detector')
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cached_yamnet(model_url: str):
+    """
+    Load a YAMNet module once per URL.
+
+    Detectors built with the same URL (e.g. for a threshold sweep) share one
+    graph instead of calling hub.load again.
+
+    Args:
+        model_url: URL to the model
+
+    Returns:
+        The loaded hub module
+    """
+    import tensorflow_hub as hub
+
+    return hub.load(model_url)
+
+
+def _read_hub_class_map(model_url: str) -> Tuple[str, ...]:
+    """
+    Read the class names from the class map bundled with a hub module.
+
+    class_map_path() returns the path of the CSV asset, not its contents, so
+    the file is read with tf.io.gfile before it is parsed.
+
+    Args:
+        model_url: URL to the model
+
+    Returns:
+        Class names in score column order
+    """
+    import tensorflow as tf
+
+    class_map_path = _get_cached_yamnet(model_url).class_map_path().numpy().decode('utf-8')
+    with tf.io.gfile.GFile(class_map_path) as f:
+        return tuple(DogBarkDetector._load_csv_as_list(f.read()))
+
+
+@functools.lru_cache(maxsize=16)
+def _get_class_info(model_url: str,
+                    dog_pattern: re.Pattern) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """
+    Get a model's class names and dog class indices, cached on disk.
+
+    The cache file is keyed by the model URL and the dog class pattern, so a
+    cold start skips parsing the class map and scanning it for dog classes.
+    It is plain JSON and checked on read, so a damaged or foreign file in
+    the cache directory is rebuilt instead of trusted.
+
+    Args:
+        model_url: URL to the model
+        dog_pattern: Compiled pattern matching dog-related names
+
+    Returns:
+        Tuple of (class_names, dog_class_indices)
+    """
+    key = hashlib.sha1(
+        repr((model_url, dog_pattern.pattern, dog_pattern.flags)).encode('utf-8'))
+    cache_path = os.path.join(CLASS_CACHE_DIR, f"yamnet_classes_{key.hexdigest()}.json")
+
+    class_info = _read_class_info_cache(cache_path)
+    if class_info is not None:
+        return class_info
+
+    class_names = _read_hub_class_map(model_url)
+    class_info = (class_names, _find_dog_class_indices(class_names, dog_pattern))
+
+    try:
+        os.makedirs(CLASS_CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so concurrent workers never read a partial file
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'class_names': list(class_info[0]),
+                       'dog_class_indices': list(class_info[1])}, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # The cache is optional (e.g. read-only home directory)
+
+    return class_info
+
+
+def _read_class_info_cache(cache_path: str) -> Optional[Tuple[Tuple[str, ...], Tuple[int, ...]]]:
+    """
+    Read class names and dog class indices written by _get_class_info.
+
+    Args:
+        cache_path: Path to the JSON cache file
+
+    Returns:
+        Tuple of (class_names, dog_class_indices), or None if the file is
+        missing, unreadable or does not hold a valid class list
+    """
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            data = json.load(f)
+        class_names = data['class_names']
+        dog_indices = data['dog_class_indices']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not (isinstance(class_names, list) and isinstance(dog_indices, list)
+            and all(isinstance(name, str) for name in class_names)
+            and all(type(idx) is int and 0 <= idx < len(class_names)
+                    for idx in dog_indices)):
+        return None
+
+    return tuple(class_names), tuple(dog_indices)
+
+
+@functools.lru_cache(maxsize=16)
+def _find_dog_class_indices(class_names: Tuple[str, ...],
+                            dog_pattern: re.Pattern) -> Tuple[int, ...]:
+    """
+    Find the indices of class names matched by the dog class pattern.
+
+    Args:
+        class_names: Model class names
+        dog_pattern: Compiled pattern matching dog-related names
+
+    Returns:
+        Matching class indices in ascending order
+    """
+    return tuple(idx for idx, class_name in enumerate(class_names)
+                 if dog_pattern.search(class_name))
 
 
 class DogBarkDetector:
@@ -28,9 +172,31 @@ class DogBarkDetector:
         'Domestic animals, pets'
     ]
 
+    # Any of the names above, matched case-insensitively in one scan per class
+    _DOG_RE = re.compile('|'.join(re.escape(name) for name in DOG_BARK_CLASSES),
+                         re.IGNORECASE)
+
+    # YAMNet framing at 16kHz: 0.48s patch hop, and the shortest waveform that
+    # yields one patch (0.96s window + 25ms STFT window - 10ms STFT hop)
+    PATCH_HOP_SAMPLES = 7680
+    MIN_WAVEFORM_SAMPLES = 15600
+
+    # Columnar layout of detection events used by the vectorized helpers
+    DETECTION_DTYPE = np.dtype([
+        ('start_time', np.float64),
+        ('end_time', np.float64),
+        ('confidence', np.float64),
+        ('class_index', np.int64),
+    ])
+
+    BACKENDS = ('hub',) + tuple(backends.EXPORTED_BACKENDS)
+
     def __init__(self, model_url: str = 'https://tfhub.dev/google/yamnet/1',
                  confidence_threshold: float = 0.3,
-                 use_gpu: bool = False):
+                 use_gpu: bool = False,
+                 backend: str = 'hub',
+                 model_path: Optional[str] = None,
+                 class_map_path: Optional[str] = None):
         """
         Initialize dog bark detector.
 
@@ -38,18 +204,50 @@ class DogBarkDetector:
             model_url: URL to YAMNet model on TensorFlow Hub
             confidence_threshold: Minimum confidence score for detection (0-1)
             use_gpu: Whether to use GPU acceleration
+            backend: 'hub' for the TensorFlow Hub model, or 'tflite' / 'onnx'
+                for an exported model run on the CPU (see backends)
+            model_path: Path to the exported model (required unless backend is 'hub')
+            class_map_path: Path to yamnet_class_map.csv (required unless
+                backend is 'hub')
+
+        Note:
+            The model is loaded once per model_url and shared by all
+            detectors. TensorFlow only allows hiding the GPU before its first
+            model load, so the first detector created decides whether the GPU
+            is used.
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend != 'hub' and (model_path is None or class_map_path is None):
+            raise ValueError(f"The {backend} backend needs model_path and class_map_path")
+        if backend == 'onnx' and use_gpu:
+            # ONNX Runtime's CUDA provider is slower than its CPU one for YAMNet
+            raise ValueError("The onnx backend only runs on the CPU")
+
         self.confidence_threshold = confidence_threshold
+        self.backend = backend
         self.model = None
+        self._infer = None
         self.class_names = None
         self.dog_class_indices = []
+        self._dog_idx_arr = np.zeros(0, dtype=np.int64)
 
-        # Configure TensorFlow
-        if not use_gpu:
-            tf.config.set_visible_devices([], 'GPU')
+        # Configure TensorFlow (disable_gpu() before the TensorFlow import
+        # avoids probing CUDA at all; this covers the case where it was not called)
+        if backend == 'hub' and not use_gpu:
+            import tensorflow as tf
+
+            try:
+                tf.config.set_visible_devices([], 'GPU')
+            except RuntimeError:
+                # TensorFlow is already initialized by an earlier detector
+                pass
 
         # Load model
-        self._load_model(model_url)
+        if backend == 'hub':
+            self._load_model(model_url)
+        else:
+            self._load_exported_model(model_path, class_map_path)
 
     def _load_model(self, model_url: str):
         """
@@ -59,30 +257,50 @@ class DogBarkDetector:
             model_url: URL to the model
         """
         print(f"Loading YAMNet model from {model_url}...")
-        self.model = hub.load(model_url)
+        self.model = _get_cached_yamnet(model_url)
         print("Model loaded successfully!")
 
         # Load class names from YAMNet
-        self._load_class_names()
+        self._load_class_names(*_get_class_info(model_url, self._DOG_RE))
+
+    def _load_exported_model(self, model_path: str, class_map_path: str):
+        """
+        Load an exported YAMNet model for a non-hub backend.
+
+        Args:
+            model_path: Path to the exported model
+            class_map_path: Path to yamnet_class_map.csv
+        """
+        print(f"Loading {self.backend} model from {model_path}...")
+        self.model = backends.EXPORTED_BACKENDS[self.backend](model_path)
+        print("Model loaded successfully!")
 
-    def _load_class_names(self):
+        self._load_class_names(tuple(backends.load_class_map(class_map_path)))
+
+    def _load_class_names(self, class_names: Tuple[str, ...],
+                          dog_class_indices: Optional[Tuple[int, ...]] = None):
         """
         Load AudioSet class names used by YAMNet.
+
+        Args:
+            class_names: Class names parsed from the model's class map
+            dog_class_indices: Indices of dog-related classes, if already known
         """
         # YAMNet uses AudioSet class names
-        class_map_path = self.model.class_map_path().numpy().decode('utf-8')
-        self.class_names = self._load_csv_as_list(class_map_path)
+        self.class_names = list(class_names)
 
         # Find indices of dog-related classes
-        self.dog_class_indices = []
-        for idx, class_name in enumerate(self.class_names):
-            for dog_class in self.DOG_BARK_CLASSES:
-                if dog_class.lower() in class_name.lower():
-                    self.dog_class_indices.append(idx)
-                    print(f"Found dog-related class: {class_name} (index: {idx})")
-                    break
+        if dog_class_indices is None:
+            dog_class_indices = _find_dog_class_indices(tuple(class_names), self._DOG_RE)
+        self.dog_class_indices = list(dog_class_indices)
+        for idx in self.dog_class_indices:
+            print(f"Found dog-related class: {self.class_names[idx]} (index: {idx})")
 
-    def _load_csv_as_list(self, csv_text: str) -> List[str]:
+        # Index array for slicing the dog columns out of a score matrix
+        self._dog_idx_arr = np.asarray(self.dog_class_indices, dtype=np.int64)
+
+    @staticmethod
+    def _load_csv_as_list(csv_text: str) -> List[str]:
         """
         Parse CSV text and return class names.
 
@@ -91,130 +309,350 @@ class DogBarkDetector:
 
         Returns:
             List of class names
-        """
-        class_names = []
-        with io.StringIO(csv_text) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                class_names.append(row['display_name'])
-        return class_names
 
-    def detect_in_waveform(self, waveform: np.ndarray, sample_rate: int = 16000) \
-            -> List[Dict]:
+        Raises:
+            ValueError: If there is no display_name column or a row is too short
+        """
+        reader = csv.reader(csv_text.splitlines())
+        header = next(reader, [])
+        if 'display_name' not in header:
+            raise ValueError("Class map has no display_name column")
+        name_col = header.index('display_name')
+
+        # Only the display_name column is read; no dict is built per row
+        try:
+            return [row[name_col] for row in reader]
+        except IndexError:
+            raise ValueError(f"Malformed class map row at line {reader.line_num}") from None
+
+    def detect_in_waveform(self, waveform: np.ndarray, sample_rate: int = 16000,
+                           out: Optional[np.ndarray] = None,
+                           chunk_offset: float = 0.0,
+                           overlap: float = 0.0) -> Detections:
         """
         Detect dog barks in audio waveform.
 
         Args:
             waveform: Audio waveform as numpy array
             sample_rate: Sample rate of the audio (YAMNet expects 16kHz)
+            out: Reusable float32 buffer of at least len(waveform) samples,
+                used when the waveform has to be converted (None = allocate)
+            chunk_offset: Time of the waveform's first sample in the whole
+                recording, added to all timestamps (seconds)
+            overlap: Leading overlap with the previous chunk; frames starting
+                inside it are dropped as the previous chunk reported them (seconds)
 
         Returns:
-            List of detection events with timestamps and confidence scores
+            Detection events with timestamps and confidence scores
         """
         # YAMNet expects 16kHz mono audio
         if sample_rate != 16000:
             raise ValueError(f"YAMNet requires 16kHz audio, got {sample_rate}Hz")
 
-        # Ensure waveform is float32
-        if waveform.dtype != np.float32:
-            waveform = waveform.astype(np.float32)
+        # Ensure waveform is contiguous float32; no copy when it already is
+        if out is not None and not (waveform.dtype == np.float32
+                                    and waveform.flags.c_contiguous):
+            out = out[:len(waveform)]
+            out[...] = waveform
+            waveform = out
+        else:
+            waveform = np.ascontiguousarray(waveform, dtype=np.float32)
 
         # Run inference
-        scores, embeddings, spectrogram = self.model(waveform)
+        return self._detections_from_scores(self._predict_scores(waveform),
+                                            chunk_offset, overlap)
 
-        # YAMNet produces scores for each 0.96 second frame
-        # Frame rate is approximately 1 frame per 0.48 seconds (50% overlap)
-        frame_duration = 0.96  # seconds
-        hop_duration = 0.48    # seconds
+    def detect_in_waveform_batch(self, waveforms: List[np.ndarray],
+                                 sample_rate: int = 16000,
+                                 chunk_offsets: Optional[List[float]] = None,
+                                 overlaps: Optional[List[float]] = None) -> List[Detections]:
+        """
+        Detect dog barks in several waveforms with a single model call.
 
-        detections = []
+        YAMNet only accepts a 1-D waveform, so the inputs are concatenated with
+        zero padding that keeps every waveform aligned to the 0.48s frame grid.
+        Frames are then split back per waveform; each frame sees exactly the
+        same samples as it would in a separate detect_in_waveform call.
 
-        # Process each frame
-        for frame_idx, frame_scores in enumerate(scores.numpy()):
-            # Check dog-related classes
-            max_dog_score = 0.0
-            max_dog_class = None
-            max_dog_class_idx = None
+        Args:
+            waveforms: List of audio waveforms as numpy arrays
+            sample_rate: Sample rate of the audio (YAMNet expects 16kHz)
+            chunk_offsets: Time offset of each waveform (see detect_in_waveform)
+            overlaps: Leading overlap of each waveform (see detect_in_waveform)
 
-            for class_idx in self.dog_class_indices:
-                if frame_scores[class_idx] > max_dog_score:
-                    max_dog_score = frame_scores[class_idx]
-                    max_dog_class = self.class_names[class_idx]
-                    max_dog_class_idx = class_idx
+        Returns:
+            Detection events of each input waveform
+        """
+        if sample_rate != 16000:
+            raise ValueError(f"YAMNet requires 16kHz audio, got {sample_rate}Hz")
+
+        if not waveforms:
+            return []
+
+        total_samples, sample_offsets, frame_ranges = self._batch_layout(
+            [len(waveform) for waveform in waveforms])
+
+        batch = np.zeros(total_samples, dtype=np.float32)
+        for waveform, sample_offset in zip(waveforms, sample_offsets):
+            batch[sample_offset:sample_offset + len(waveform)] = waveform
+
+        scores = self._predict_scores(batch)
+
+        if chunk_offsets is None:
+            chunk_offsets = [0.0] * len(waveforms)
+        if overlaps is None:
+            overlaps = [0.0] * len(waveforms)
+
+        return [self._detections_from_scores(scores[start:end], chunk_offset, overlap)
+                for (start, end), chunk_offset, overlap in zip(
+                    frame_ranges, chunk_offsets, overlaps)]
+
+    @classmethod
+    def _batch_layout(cls, lengths: List[int]) -> Tuple[int, List[int], List[Tuple[int, int]]]:
+        """
+        Place waveforms of the given lengths in one zero-padded batch.
+
+        Every waveform starts on the frame hop grid and is followed by enough
+        zeros that its last frame only sees zeros past its end, as it would
+        when scored alone.
+
+        Args:
+            lengths: Number of samples of each waveform
+
+        Returns:
+            Tuple of (batch length in samples, sample offset of each waveform,
+            (start, end) range of each waveform's frames in the batch scores)
+        """
+        hop = cls.PATCH_HOP_SAMPLES
+        total_samples = 0
+        sample_offsets = []
+        frame_ranges = []
+
+        for length in lengths:
+            # Number of frames YAMNet produces for this waveform on its own
+            num_frames = 1 + max(0, -(-(length - cls.MIN_WAVEFORM_SAMPLES) // hop))
+            # Pad so the last frame only sees zeros past the end, as it would alone
+            needed = (num_frames - 1) * hop + cls.MIN_WAVEFORM_SAMPLES
+            sample_offsets.append(total_samples)
+            frame_ranges.append((total_samples // hop, total_samples // hop + num_frames))
+            total_samples += -(-needed // hop) * hop
+
+        return total_samples, sample_offsets, frame_ranges
+
+    def _predict_scores(self, waveform: np.ndarray) -> np.ndarray:
+        """
+        Compute per-frame class scores with the configured backend.
 
-            # If confidence exceeds threshold, record detection
-            if max_dog_score >= self.confidence_threshold:
-                start_time = frame_idx * hop_duration
-                end_time = start_time + frame_duration
+        Args:
+            waveform: 16kHz mono float32 waveform
 
-                detections.append({
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'confidence': float(max_dog_score),
-                    'class_name': max_dog_class,
-                    'class_index': max_dog_class_idx
-                })
+        Returns:
+            Scores of shape (num_frames, num_classes)
+        """
+        if self.backend == 'hub':
+            return self._run_model(waveform).numpy()
+        return self.model(waveform)
+
+    def _run_model(self, waveform: np.ndarray) -> 'tf.Tensor':
+        """
+        Run YAMNet through a concrete function that returns only the scores.
 
-        return detections
+        The function has a fixed 1-D float32 signature and is traced once on
+        first use, so waveforms of different lengths reuse the same graph, and
+        the embeddings and spectrogram outputs are never returned to Python.
 
-    def merge_detections(self, detections: List[Dict],
-                        merge_gap: float = 1.0) -> List[Dict]:
+        Args:
+            waveform: 16kHz mono float32 waveform
+
+        Returns:
+            Scores tensor of shape (num_frames, num_classes)
+        """
+        import tensorflow as tf
+
+        if self._infer is None:
+            model = self.model
+
+            @tf.function(input_signature=[tf.TensorSpec([None], tf.float32)])
+            def scores_only(waveform):
+                scores, _, _ = model(waveform)
+                return scores
+
+            self._infer = scores_only.get_concrete_function()
+        return self._infer(tf.constant(waveform))
+
+    def _detections_from_scores(self, scores: np.ndarray, chunk_offset: float = 0.0,
+                                overlap: float = 0.0) -> Detections:
+        """
+        Convert per-frame YAMNet scores into detection events.
+
+        Args:
+            scores: Array of shape (num_frames, num_classes)
+            chunk_offset: Time added to all timestamps (seconds)
+            overlap: Frames starting before this time are dropped (seconds)
+
+        Returns:
+            Detection events with timestamps offset by chunk_offset
+        """
+        # YAMNet produces scores for each 0.96 second frame
+        # Frame rate is approximately 1 frame per 0.48 seconds (50% overlap)
+        frame_duration = 0.96  # seconds
+        hop_duration = 0.48    # seconds
+
+        if len(self._dog_idx_arr):
+            # Best dog class per frame, taken from the dog columns only
+            dog_scores = scores[:, self._dog_idx_arr]
+            best_local = dog_scores.argmax(axis=1)
+            best_score = np.take_along_axis(dog_scores, best_local[:, None], axis=1).ravel()
+            # Frames where no dog class scored above zero have no class
+            best_class = np.where(best_score > 0, self._dog_idx_arr[best_local], -1)
+        else:
+            best_score = np.zeros(len(scores), dtype=np.float32)
+            best_class = np.full(len(scores), -1, dtype=np.int64)
+
+        # Only frames whose confidence exceeds the threshold become detections,
+        # minus those in the leading overlap
+        frame_starts = np.arange(len(scores)) * hop_duration
+        hits = np.flatnonzero((best_score >= self.confidence_threshold)
+                              & (frame_starts >= overlap))
+
+        starts = frame_starts[hits]
+        ends = starts + frame_duration
+        starts += chunk_offset
+        ends += chunk_offset
+
+        return Detections(starts, ends, best_score[hits], best_class[hits],
+                          self.class_names)
+
+    def merge_detections(self, detections: Union[Detections, List[Dict]],
+                        merge_gap: float = 1.0) -> Detections:
         """
         Merge nearby detections into continuous events.
 
         Args:
-            detections: List of detection events
+            detections: Detections or list of detection events
             merge_gap: Maximum gap between detections to merge (seconds)
 
         Returns:
-            List of merged detection events
+            Merged detection events. When dicts were given (or handed out by
+            Detections), each event's dict is a copy of its first detection's,
+            so extra keys are kept
         """
-        if not detections:
-            return []
+        from_arrays = isinstance(detections, Detections) and detections._dicts is None
+        class_names = (detections.class_names if isinstance(detections, Detections)
+                       else self.class_names)
+
+        starts, ends, confidences = _detection_columns(detections)
+        if from_arrays:
+            class_indices = detections.class_indices
+        else:
+            # class_index is None when no dog class scored above zero
+            class_indices = np.array([-1 if d['class_index'] is None else d['class_index']
+                                      for d in detections], dtype=np.int64)
+
+        order = np.argsort(starts, kind='stable')
+        group_starts, group_ends, group_confidences = _kernels.merge_sorted(
+            starts[order], ends[order], confidences[order], float(merge_gap))
+        first = order[group_starts]
+
+        # Each event keeps the start and class of its first detection, with
+        # the group's end and highest confidence
+        merged = Detections(starts[first], group_ends, group_confidences,
+                            class_indices[first], class_names)
+        if from_arrays:
+            return merged
+
+        events = []
+        for first_idx, end_time, confidence in zip(first.tolist(), group_ends.tolist(),
+                                                   group_confidences.tolist()):
+            event = detections[first_idx].copy()
+            event['end_time'] = end_time
+            event['confidence'] = confidence
+            events.append(event)
+        merged._dicts = events
 
-        # Sort by start time
-        sorted_detections = sorted(detections, key=lambda x: x['start_time'])
+        return merged
 
-        merged = []
-        current = sorted_detections[0].copy()
+    def merge_detections_vec(self, detections: np.ndarray,
+                             merge_gap: float = 1.0) -> np.ndarray:
+        """
+        Merge nearby detections held in a structured array (see DETECTION_DTYPE).
 
-        for detection in sorted_detections[1:]:
-            # If gap is small enough, merge
-            if detection['start_time'] - current['end_time'] <= merge_gap:
-                current['end_time'] = max(current['end_time'], detection['end_time'])
-                current['confidence'] = max(current['confidence'], detection['confidence'])
-            else:
-                # Save current and start new
-                merged.append(current)
-                current = detection.copy()
+        Structured-array equivalent of merge_detections.
 
-        # Add last detection
-        merged.append(current)
+        Args:
+            detections: Structured array of detection events
+            merge_gap: Maximum gap between detections to merge (seconds)
+
+        Returns:
+            Structured array of merged detection events
+        """
+        if len(detections) == 0:
+            return detections[:0]
+
+        ordered = detections[np.argsort(detections['start_time'], kind='stable')]
+        group_starts, group_ends, group_confidences = _kernels.merge_sorted(
+            np.ascontiguousarray(ordered['start_time']),
+            np.ascontiguousarray(ordered['end_time']),
+            np.ascontiguousarray(ordered['confidence']), float(merge_gap))
+
+        # Each event keeps the start and class of its first detection
+        merged = ordered[group_starts]
+        merged['end_time'] = group_ends
+        merged['confidence'] = group_confidences
 
         return merged
 
-    def format_timestamp(self, seconds: float) -> str:
+    def detections_to_array(self, detections: Union[Detections, List[Dict]]) -> np.ndarray:
         """
-        Format seconds as HH:MM:SS.mmm
+        Convert detection events into a structured array (see DETECTION_DTYPE).
 
         Args:
-            seconds: Time in seconds
+            detections: Detections or list of detection events
 
         Returns:
-            Formatted timestamp string
+            Structured array with one row per detection
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
+        array = np.empty(len(detections), dtype=self.DETECTION_DTYPE)
+        array['start_time'], array['end_time'], array['confidence'] = (
+            _detection_columns(detections))
+        if isinstance(detections, Detections) and detections._dicts is None:
+            array['class_index'] = detections.class_indices
+            return array
+
+        # class_index is None when no dog class scored above zero
+        array['class_index'] = [-1 if d['class_index'] is None else d['class_index']
+                                for d in detections]
+        return array
+
+    def array_to_detections(self, detections: np.ndarray) -> Detections:
+        """
+        Convert a structured array of detections into Detections.
 
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        Args:
+            detections: Structured array (see DETECTION_DTYPE)
 
-    def print_detections(self, detections: List[Dict], offset: float = 0.0):
+        Returns:
+            Detections holding the array's columns (dicts are only built on access)
+        """
+        return Detections(np.ascontiguousarray(detections['start_time']),
+                          np.ascontiguousarray(detections['end_time']),
+                          np.ascontiguousarray(detections['confidence']),
+                          np.ascontiguousarray(detections['class_index']),
+                          self.class_names)
+
+    # TensorFlow-free helpers (see dog_bark_detector.detections), kept here
+    # for existing callers
+    format_timestamp = staticmethod(_detections.format_timestamp)
+    format_timestamps = staticmethod(_detections.format_timestamps)
+    get_detection_summary = staticmethod(_detections.get_detection_summary)
+
+    def print_detections(self, detections: Union[Detections, List[Dict]],
+                         offset: float = 0.0):
         """
         Print detection results in a readable format.
 
         Args:
-            detections: List of detection events
+            detections: Detections or list of detection events
             offset: Time offset to add to timestamps (for chunked processing)
         """
         if not detections:
@@ -225,46 +663,18 @@ class DogBarkDetector:
         print(f"Found {len(detections)} dog bark event(s):")
         print(f"{'='*80}")
 
-        for idx, detection in enumerate(detections, 1):
-            start = detection['start_time'] + offset
-            end = detection['end_time'] + offset
-            duration = end - start
+        starts, ends, confidences = _detection_columns(detections)
+        starts = starts + offset
+        ends = ends + offset
+        class_names = _detection_class_names(detections)
 
+        for idx, (start, end, duration, confidence, class_name) in enumerate(
+                zip(starts.tolist(), ends.tolist(), (ends - starts).tolist(),
+                    confidences.tolist(), class_names), 1):
             print(f"\n[Event #{idx}]")
             print(f"  Time: {self.format_timestamp(start)} - {self.format_timestamp(end)}")
             print(f"  Duration: {duration:.2f} seconds")
-            print(f"  Confidence: {detection['confidence']:.2%}")
-            print(f"  Type: {detection['class_name']}")
+            print(f"  Confidence: {confidence:.2%}")
+            print(f"  Type: {class_name}")
 
         print(f"\n{'='*80}\n")
-
-    def get_detection_summary(self, detections: List[Dict]) -> Dict:
-        """
-        Get summary statistics of detections.
-
-        Args:
-            detections: List of detection events
-
-        Returns:
-            Dictionary with summary statistics
-        """
-        if not detections:
-            return {
-                'total_events': 0,
-                'total_duration': 0.0,
-                'avg_confidence': 0.0,
-                'max_confidence': 0.0,
-                'min_confidence': 0.0
-            }
-
-        confidences = [d['confidence'] for d in detections]
-        durations = [d['end_time'] - d['start_time'] for d in detections]
-
-        return {
-            'total_events': len(detections),
-            'total_duration': sum(durations),
-            'avg_duration': np.mean(durations),
-            'avg_confidence': np.mean(confidences),
-            'max_confidence': max(confidences),
-            'min_confidence': min(confidences)
-        }
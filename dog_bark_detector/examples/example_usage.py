@@ -5,6 +5,7 @@ Examples of using the Dog Bark Detection library.
 This file demonstrates various ways to use the dog_bark_detector package.
 """
 
+import itertools
 import sys
 import os
 
@@ -12,6 +13,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from dog_bark_detector import DogBarkDetector, AudioProcessor, GDriveDownloader
+from dog_bark_detector.utils import prefetch
 
 
 def example_1_basic_detection():
@@ -69,21 +71,30 @@ def example_2_process_long_file():
     all_detections = []
 
     # Process in 60-second chunks with 2-second overlap
-    for audio_chunk, start_time, end_time in audio_processor.process_in_chunks(
-            audio_file, chunk_duration=60.0, overlap=2.0):
-
-        print(f"Processing: {detector.format_timestamp(start_time)} - "
-              f"{detector.format_timestamp(end_time)}")
-
-        # Detect in chunk
-        detections = detector.detect_in_waveform(audio_chunk)
-
-        # Adjust timestamps to global time
-        for d in detections:
-            d['start_time'] += start_time
-            d['end_time'] += start_time
-
-        all_detections.extend(detections)
+    # (the next chunks are decoded in the background during inference)
+    overlap = 2.0
+    chunks = prefetch(audio_processor.process_in_chunks(
+        audio_file, chunk_duration=60.0, overlap=overlap), n=2)
+
+    # Run the model once per batch of 4 chunks
+    while True:
+        batch = list(itertools.islice(chunks, 4))
+        if not batch:
+            break
+
+        for _, start_time, end_time in batch:
+            print(f"Processing: {detector.format_timestamp(start_time)} - "
+                  f"{detector.format_timestamp(end_time)}")
+
+        # Detect in all chunks of the batch, with timestamps in global time;
+        # frames in a chunk's leading overlap were reported by the previous chunk
+        batch_detections = detector.detect_in_waveform_batch(
+            [audio_chunk for audio_chunk, _, _ in batch],
+            chunk_offsets=[start_time for _, start_time, _ in batch],
+            overlaps=[overlap if start_time > 0 else 0.0 for _, start_time, _ in batch])
+
+        for detections in batch_detections:
+            all_detections.extend(detections)
 
     # Merge nearby detections
     merged = detector.merge_detections(all_detections, merge_gap=1.0)
@@ -122,8 +133,7 @@ def example_3_custom_confidence():
         print(f"Detected {len(detections)} events")
 
         if detections:
-            avg_conf = sum(d['confidence'] for d in detections) / len(detections)
-            print(f"Average confidence: {avg_conf:.2%}")
+            print(f"Average confidence: {detections.confidences.mean():.2%}")
 
 
 def example_4_google_drive():
@@ -167,6 +177,11 @@ def example_5_export_to_json():
 
     import json
 
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
     audio_file = 'path/to/audio.mp3'
 
     if not os.path.exists(audio_file):
@@ -180,32 +195,64 @@ def example_5_export_to_json():
     audio, sr = audio_processor.load_audio(audio_file)
     detections = detector.detect_in_waveform(audio)
 
-    # Prepare results for JSON
+    # Prepare results for JSON, reading the detection arrays directly
     results = {
         'file': audio_file,
         'total_events': len(detections),
-        'detections': []
+        'detections': [
+            {
+                'event_number': idx,
+                'start_time': start,
+                'end_time': end,
+                'start_timestamp': start_timestamp,
+                'end_timestamp': end_timestamp,
+                'duration': end - start,
+                'confidence': confidence,
+                'class_name': detector.class_names[class_idx] if class_idx >= 0 else None
+            }
+            for idx, (start, end, start_timestamp, end_timestamp, confidence,
+                      class_idx) in enumerate(
+                zip(detections.starts.tolist(), detections.ends.tolist(),
+                    detector.format_timestamps(detections.starts),
+                    detector.format_timestamps(detections.ends),
+                    detections.confidences.tolist(),
+                    detections.class_indices.tolist()), 1)
+        ]
     }
 
-    for idx, d in enumerate(detections, 1):
-        results['detections'].append({
-            'event_number': idx,
-            'start_time': d['start_time'],
-            'end_time': d['end_time'],
-            'start_timestamp': detector.format_timestamp(d['start_time']),
-            'end_timestamp': detector.format_timestamp(d['end_time']),
-            'duration': d['end_time'] - d['start_time'],
-            'confidence': d['confidence'],
-            'class_name': d['class_name']
-        })
-
-    # Save to JSON
+    # Save to JSON (orjson is much faster than the standard library encoder)
     output_file = 'detection_results.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        encoded = orjson.dumps(results, option=orjson.OPT_INDENT_2
+                               | orjson.OPT_SERIALIZE_NUMPY)
+        with open(output_file, 'wb') as f:
+            f.write(encoded)
+        encoded = encoded.decode('utf-8')
+    else:
+        encoded = json.dumps(results, indent=2, ensure_ascii=False)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(encoded)
 
     print(f"Results saved to {output_file}")
-    print(json.dumps(results, indent=2))
+    print(encoded)
+
+
+# Per-process detector for example 6, loaded once by each worker
+_WORKER_DETECTOR = None
+_WORKER_AUDIO_PROCESSOR = None
+
+
+def _init_worker(threshold: float):
+    """Load the model once in a batch worker process."""
+    global _WORKER_DETECTOR, _WORKER_AUDIO_PROCESSOR
+    _WORKER_DETECTOR = DogBarkDetector(confidence_threshold=threshold)
+    _WORKER_AUDIO_PROCESSOR = AudioProcessor()
+
+
+def _process_one(audio_file: str):
+    """Detect dog barks in one file with the worker's detector."""
+    audio, sr = _WORKER_AUDIO_PROCESSOR.load_audio(audio_file)
+    return _WORKER_DETECTOR.detect_in_waveform(audio)
 
 
 def example_6_batch_processing():
@@ -216,7 +263,9 @@ def example_6_batch_processing():
     print("Example 6: Batch Processing")
     print("="*80 + "\n")
 
+    import concurrent.futures
     import glob
+    import multiprocessing
 
     # Get all audio files in a directory
     audio_files = glob.glob('path/to/audio/folder/*.mp3')
@@ -225,31 +274,37 @@ def example_6_batch_processing():
         print("Note: No audio files found. Please update the path.")
         return
 
-    detector = DogBarkDetector(confidence_threshold=0.3)
-    audio_processor = AudioProcessor()
-
     all_results = {}
 
-    for audio_file in audio_files:
-        print(f"\nProcessing: {os.path.basename(audio_file)}")
-        print("-" * 60)
-
-        try:
-            # Load and process
-            audio, sr = audio_processor.load_audio(audio_file)
-            detections = detector.detect_in_waveform(audio)
-
-            # Store results
-            all_results[audio_file] = {
-                'total_events': len(detections),
-                'detections': detections
-            }
-
-            print(f"Found {len(detections)} bark events")
-
-        except Exception as e:
-            print(f"Error processing {audio_file}: {str(e)}")
-            continue
+    # Files are independent, so each worker process loads the model once and
+    # handles many files (processes, because TensorFlow is not fork-safe and
+    # threads would contend for the GIL)
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(audio_files)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker, initargs=(0.3,)) as executor:
+        futures = {executor.submit(_process_one, audio_file): audio_file
+                   for audio_file in audio_files}
+
+        for future in concurrent.futures.as_completed(futures):
+            audio_file = futures[future]
+            print(f"\nProcessed: {os.path.basename(audio_file)}")
+            print("-" * 60)
+
+            try:
+                detections = future.result()
+
+                # Store results
+                all_results[audio_file] = {
+                    'total_events': len(detections),
+                    'detections': detections
+                }
+
+                print(f"Found {len(detections)} bark events")
+
+            except Exception as e:
+                print(f"Error processing {audio_file}: {str(e)}")
+                continue
 
     # Summary
     print("\n" + "="*80)
@@ -4,23 +4,34 @@ Google Drive file downloader with support for large files and direct/shared link
 
 import os
 import re
+import shutil
 from typing import Optional
 import requests
 from tqdm import tqdm
 
 
+# Patterns are compiled once at import instead of on every call
+_GDRIVE_RE = re.compile(r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)')
+_FILE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_CONFIRM_RE = re.compile(r'name="confirm"\s+value="([^"]+)"')
+_UUID_RE = re.compile(r'name="uuid"\s+value="([^"]+)"')
+_ACTION_RE = re.compile(r'action="([^"]+)"')
+_SHORT_ID_RE = re.compile(r'/d/([a-zA-Z0-9_-]+)')
+
+
 class GDriveDownloader:
     """
     Download files from Google Drive with support for both direct and shared links.
     Handles large files efficiently with progress tracking.
     """
 
-    CHUNK_SIZE = 32768  # 32KB chunks
+    CHUNK_SIZE = 1 << 20  # 1MB reads and writes
     DRIVE_URL_PATTERNS = [
-        r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
+        _GDRIVE_RE.pattern,
         r'https://drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
         r'[?&]id=([a-zA-Z0-9_-]+)',  # Match id= parameter (covers uc?id= and export=download&id=)
     ]
+    _DRIVE_URL_RES = [re.compile(pattern) for pattern in DRIVE_URL_PATTERNS]
 
     def __init__(self):
         """Initialize GDrive downloader."""
@@ -36,13 +47,13 @@ class GDriveDownloader:
         Returns:
             File ID or None if not found
         """
-        for pattern in self.DRIVE_URL_PATTERNS:
-            match = re.search(pattern, url)
+        for pattern in self._DRIVE_URL_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
 
         # Check if it's already just a file ID
-        if re.match(r'^[a-zA-Z0-9_-]+$', url):
+        if _FILE_ID_RE.match(url):
             return url
 
         return None
@@ -77,10 +88,14 @@ class GDriveDownloader:
         try:
             response = self.session.get(download_url, stream=True)
 
-            # Check for virus scan warning (large files)
-            if 'download_warning' in response.text or 'virus scan' in response.text.lower():
-                download_url = self._get_confirm_token_url(response, file_id)
-                response = self.session.get(download_url, stream=True)
+            # Check for virus scan warning (large files); only HTML pages are
+            # read as text, so a direct file download stays unread for streaming
+            if 'text/html' in response.headers.get('content-type', ''):
+                if 'download_warning' in response.text or 'virus scan' in response.text.lower():
+                    download_url = self._get_confirm_token_url(response, file_id)
+                    response = self.session.get(download_url, stream=True)
+                else:
+                    raise Exception("Google Drive returned a web page instead of the file")
 
             # Check response
             if response.status_code != 200:
@@ -92,20 +107,17 @@ class GDriveDownloader:
             # Create output directory if needed
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Download with progress bar
+            # Copy the socket stream straight to the file in large blocks
+            response.raw.decode_content = True
             with open(output_path, 'wb') as f:
                 if show_progress and total_size > 0:
-                    with tqdm(total=total_size, unit='B', unit_scale=True,
-                             desc=os.path.basename(output_path)) as pbar:
-                        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                            if chunk:
-                                f.write(chunk)
-                                pbar.update(len(chunk))
+                    # The progress bar is updated by the wrapped write itself
+                    with tqdm.wrapattr(f, 'write', total=total_size,
+                                       desc=os.path.basename(output_path)) as out:
+                        shutil.copyfileobj(response.raw, out, self.CHUNK_SIZE)
                 else:
                     # No progress bar
-                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, self.CHUNK_SIZE)
 
             print(f"Download complete: {output_path}")
             return output_path
@@ -133,18 +145,18 @@ class GDriveDownloader:
                 return f"https://drive.google.com/uc?export=download&confirm={value}&id={file_id}"
 
         # Method 2: Parse confirm value from HTML form
-        confirm_match = re.search(r'name="confirm"\s+value="([^"]+)"', response.text)
+        confirm_match = _CONFIRM_RE.search(response.text)
         if confirm_match:
             confirm = confirm_match.group(1)
             return f"https://drive.google.com/uc?export=download&confirm={confirm}&id={file_id}"
 
         # Method 3: Parse from download form action URL (new Google Drive format)
-        action_match = re.search(r'action="([^"]+)"', response.text)
+        action_match = _ACTION_RE.search(response.text)
         if action_match:
             action_url = action_match.group(1)
             # Extract confirm and uuid from form
-            confirm_match = re.search(r'name="confirm"\s+value="([^"]+)"', response.text)
-            uuid_match = re.search(r'name="uuid"\s+value="([^"]+)"', response.text)
+            confirm_match = _CONFIRM_RE.search(response.text)
+            uuid_match = _UUID_RE.search(response.text)
 
             if confirm_match and uuid_match:
                 confirm = confirm_match.group(1)
@@ -215,7 +227,7 @@ def download_with_gdown(url_or_id: str, output_path: str) -> str:
 
         # Extract file ID if URL
         if 'drive.google.com' in url_or_id:
-            match = re.search(r'/d/([a-zA-Z0-9_-]+)', url_or_id)
+            match = _SHORT_ID_RE.search(url_or_id)
             if match:
                 file_id = match.group(1)
                 url = f'https://drive.google.com/uc?id={file_id}'
@@ -0,0 +1,65 @@
+"""
+Pipeline helpers shared by the command line tool and the examples.
+"""
+
+import queue
+import threading
+from typing import Iterable, Iterator
+
+
+def prefetch(iterable: Iterable, n: int = 2) -> Iterator:
+    """
+    Iterate over an iterable while a background thread produces items ahead.
+
+    Decoding (ffmpeg/soundfile) and TensorFlow inference both release the GIL,
+    so wrapping a chunk generator such as AudioProcessor.process_in_chunks
+    overlaps decoding of the next chunks with inference on the current one.
+
+    Args:
+        iterable: Iterable to consume in the background
+        n: Maximum number of items produced ahead of the consumer
+
+    Yields:
+        Items from ``iterable`` in their original order
+    """
+    buffer = queue.Queue(maxsize=max(1, n))
+    sentinel = object()
+    stop = threading.Event()
+    error = []
+
+    def _put(item) -> bool:
+        # Poll so the producer exits promptly if the consumer stops early
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer():
+        try:
+            for item in iterable:
+                if not _put(item):
+                    return
+        except Exception as e:
+            error.append(e)
+        finally:
+            _put(sentinel)
+
+    producer = threading.Thread(target=_producer, name='prefetch',
+                                daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is sentinel:
+                break
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+    if error:
+        raise error[0]
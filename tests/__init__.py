@@ -3,8 +3,23 @@ Test suite for dog bark detection system.
 
 This package contains various test modules:
 - test_installation.py: Verify system installation and dependencies
+- test_backends.py: Exported-model backends without TensorFlow
+- test_audio_processor.py: Chunked audio streaming
+- test_detector.py: Hub class map loading with a stand-in tf.io.gfile
+- test_merge.py: Merge kernels compared with the original Python merge
+- test_detect_bark.py: detect_bark.py helpers such as overlap de-duplication
 - test_gdrive.py: Test Google Drive downloader functionality
 - test_gdrive_simple.py: Simple URL parsing tests (no dependencies)
 - test_real_gdrive.py: Test actual Google Drive file download
 - test_download_large.py: Test large file download with virus scan handling
+- _gdrive_common.py: URL parsing, download and file type helpers shared by the above
 """
+
+import pathlib
+import sys
+
+# Repository root, resolved once; importing the package puts it on sys.path
+# so the test modules can import dog_bark_detector
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
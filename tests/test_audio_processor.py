@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked audio streaming, activity detection and normalization
+(no TensorFlow required).
+
+Short WAV files are written with soundfile and read back through
+process_in_chunks and stream_chunks.
+"""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from dog_bark_detector.audio_processor import AudioProcessor
+
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def write_wav(tmp_path):
+    """Write float32 noise of the given duration and return (path, samples)."""
+    def write(duration):
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-0.5, 0.5, int(duration * SAMPLE_RATE)).astype(np.float32)
+        path = tmp_path / f'noise_{duration}s.wav'
+        sf.write(str(path), audio, SAMPLE_RATE, subtype='FLOAT')
+        return str(path), audio
+    return write
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('duration, expected', [
+    # The trailing 16-18s window would hold only overlap, so it is dropped
+    (18.0, [(0.0, 10.0), (8.0, 18.0)]),
+    (19.0, [(0.0, 10.0), (8.0, 18.0), (16.0, 19.0)]),
+    (26.0, [(0.0, 10.0), (8.0, 18.0), (16.0, 26.0)]),
+    (3.0, [(0.0, 3.0)]),
+])
+def test_process_in_chunks_windows(write_wav, duration, expected):
+    """Chunks start every chunk - overlap seconds and cover the whole file."""
+    path, audio = write_wav(duration)
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    chunks = list(processor.process_in_chunks(path, chunk_duration=10.0, overlap=2.0))
+
+    assert [(start, end) for _, start, end in chunks] == expected
+    for chunk, start, end in chunks:
+        assert chunk.dtype == np.float32
+        assert np.array_equal(
+            chunk, audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('num_buffers', [0, 2])
+def test_stream_chunks_matches_full_audio(write_wav, num_buffers):
+    """Windows equal slices of the fully loaded audio, with or without a pool."""
+    path, audio = write_wav(5.3)
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+    chunk_samples, overlap_samples = 16000, 4000
+    step = chunk_samples - overlap_samples
+
+    count = 0
+    for idx, window in enumerate(processor.stream_chunks(
+            path, chunk_samples, overlap_samples, num_buffers=num_buffers)):
+        # Pooled windows are reused, so compare before requesting the next
+        assert np.array_equal(window, audio[idx * step:idx * step + chunk_samples])
+        count += 1
+
+    # 84800 samples: windows start at 0, 12000, ..., 72000; 72000 + 4000 < 84800
+    assert count == 7
+
+
+@pytest.mark.unit
+def test_stream_chunks_rejects_overlap_not_shorter_than_chunk(write_wav):
+    """An overlap as long as the chunk would never advance."""
+    path, _ = write_wav(1.0)
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    with pytest.raises(ValueError):
+        next(processor.stream_chunks(path, 1000, 1000))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('dtype, expected', [
+    (np.int16, np.float64),
+    (np.int32, np.float64),
+    (np.float32, np.float32),
+    (np.float64, np.float64),
+])
+def test_normalize_audio_dtype(dtype, expected):
+    """Normalization returns what plain division by the peak would."""
+    audio = np.array([1, -4, 2, 0], dtype=dtype)
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    normalized = processor.normalize_audio(audio)
+
+    assert normalized.dtype == expected
+    assert np.allclose(normalized, audio / np.abs(audio).max())
+
+
+def voiced(duration):
+    """Harmonic 150 Hz signal that webrtcvad classifies as speech."""
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 20))
+    return (0.3 * signal / np.abs(signal).max()).astype(np.float32)
+
+
+def silence(duration):
+    """Digital silence of the given duration."""
+    return np.zeros(int(duration * SAMPLE_RATE), dtype=np.float32)
+
+
+@pytest.mark.unit
+def test_find_active_regions_pads_and_merges():
+    """Active frames are padded; bursts closer than twice the padding merge."""
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+    frame = 512  # 32 ms
+    audio = np.zeros(200 * frame, dtype=np.float32)
+    audio[32 * frame:48 * frame] = 0.5
+    audio[52 * frame:56 * frame] = 0.5    # 4 frames after the first burst: merged
+    audio[150 * frame:151 * frame] = 0.5  # Far away: separate region
+
+    regions = processor.find_active_regions(audio, rms_threshold=0.01, padding=0.25)
+
+    pad = 4000
+    assert regions == [(32 * frame - pad, 56 * frame + pad),
+                       (150 * frame - pad, 151 * frame + pad)]
+
+
+@pytest.mark.unit
+def test_find_active_regions_edges_and_silence():
+    """Regions are clipped to the audio; silence gives no regions."""
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+    audio = np.zeros(10000, dtype=np.float32)
+
+    assert processor.find_active_regions(audio) == []
+
+    # Activity in the first frame and in the partial tail frame
+    audio[:100] = 0.5
+    audio[-10:] = 0.5
+    assert processor.find_active_regions(audio, padding=0.1) == [(0, 1600 + 512),
+                                                                 (9728 - 1600, 10000)]
+
+
+@pytest.mark.unit
+def test_find_active_regions_entropy_keeps_tones():
+    """With an entropy threshold, broadband noise is dropped and tones kept."""
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+    segment = 32 * 512  # Whole 32 ms frames
+    rng = np.random.default_rng(0)
+    noise = rng.uniform(-0.5, 0.5, segment).astype(np.float32)
+    tone = (0.5 * np.sin(2 * np.pi * 1000 * np.arange(segment) / SAMPLE_RATE)
+            ).astype(np.float32)
+    audio = np.concatenate([noise, np.zeros(segment, dtype=np.float32), tone])
+
+    regions = processor.find_active_regions(audio, entropy_threshold=0.5, padding=0.0)
+
+    assert regions == [(2 * segment, 3 * segment)]
+
+
+@pytest.fixture
+def vad_wav(tmp_path):
+    """Write a WAV of alternating speech-like and silent segments."""
+    def write(*segments):
+        path = tmp_path / 'vad.wav'
+        sf.write(str(path), np.concatenate(segments), SAMPLE_RATE, subtype='FLOAT')
+        return str(path)
+    return write
+
+
+def assert_spans_well_formed(spans, pad, max_chunk):
+    """Split pieces overlap by exactly pad; separate spans never overlap."""
+    for (start, end), (next_start, next_end) in zip(spans, spans[1:]):
+        assert next_start > start and next_end > end
+        if next_start < end:
+            # Continuation of a span split at max_chunk
+            assert end - start == pytest.approx(max_chunk)
+            assert end - next_start == pytest.approx(pad)
+    for start, end in spans:
+        assert 0 < end - start <= max_chunk + 1e-9
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('max_chunk', [30.0, 1.0])
+def test_iter_active_chunks_spans(vad_wav, max_chunk):
+    """Speech segments become padded spans that cover them without overlap."""
+    pytest.importorskip('webrtcvad')
+    path = vad_wav(silence(2.0), voiced(3.0), silence(3.0), voiced(1.0), silence(2.0))
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    chunks = list(processor.iter_active_chunks(path, pad=0.5, max_chunk=max_chunk))
+    spans = [(start, end) for _, start, end in chunks]
+
+    assert_spans_well_formed(spans, pad=0.5, max_chunk=max_chunk)
+    for chunk, start, end in chunks:
+        assert len(chunk) == round((end - start) * SAMPLE_RATE)
+    # Both speech segments lie inside spans; the silence between them does not
+    for speech_start, speech_end in [(2.0, 5.0), (8.0, 9.0)]:
+        assert any(start <= speech_start + 0.03 for start, _ in spans)
+        assert any(end >= speech_end - 0.03 for _, end in spans)
+    assert not any(start < 7.0 and end > 6.0 for start, end in spans)
+
+
+@pytest.mark.unit
+def test_iter_active_chunks_short_gap_after_split(vad_wav):
+    """Speech resuming right after a span closes at a split starts past it."""
+    pytest.importorskip('webrtcvad')
+    path = vad_wav(silence(1.0), voiced(0.8), silence(0.65), voiced(0.4), silence(1.0))
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    spans = [(start, end) for _, start, end in
+             processor.iter_active_chunks(path, pad=0.3, max_chunk=1.0)]
+
+    assert len(spans) >= 2
+    assert_spans_well_formed(spans, pad=0.3, max_chunk=1.0)
+
+
+@pytest.mark.unit
+def test_iter_active_chunks_rejects_pad_not_shorter_than_max_chunk(vad_wav):
+    """A split chunk restarts pad before the split, so pad must be shorter."""
+    pytest.importorskip('webrtcvad')
+    path = vad_wav(voiced(1.0))
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    with pytest.raises(ValueError):
+        next(processor.iter_active_chunks(path, pad=1.0, max_chunk=1.0))
+
+
+@pytest.mark.unit
+def test_load_audio_falls_back_when_soundfile_cannot_read(tmp_path, monkeypatch):
+    """A .wav that libsndfile rejects is passed on to librosa."""
+    path = tmp_path / 'mislabeled.wav'
+    path.write_bytes(b'ID3 not a RIFF file')
+    calls = []
+
+    class FakeLibrosa:
+        @staticmethod
+        def load(file_path, **kwargs):
+            calls.append(file_path)
+            return np.zeros(10, dtype=np.float32), kwargs['sr']
+
+    monkeypatch.setattr('dog_bark_detector.audio_processor._get_librosa',
+                        lambda: FakeLibrosa)
+    processor = AudioProcessor(sample_rate=SAMPLE_RATE)
+
+    audio, sr = processor.load_audio(str(path))
+
+    assert calls == [str(path)]
+    assert sr == SAMPLE_RATE
+    assert len(audio) == 10
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the exported-model backends and batch layout (no TensorFlow required).
+
+TensorFlow is blocked in sys.modules, so these tests fail if the detector
+imports it for a non-hub backend.
+"""
+
+import importlib
+import sys
+
+import numpy as np
+import pytest
+
+
+PATCH_SAMPLES = 15600
+PATCH_HOP_SAMPLES = 7680
+
+
+class FakeInterpreter:
+    """Stand-in for tflite_runtime's Interpreter scoring one patch per call."""
+
+    def __init__(self, model_path, num_threads=None):
+        self.tensors = {}
+
+    def allocate_tensors(self):
+        pass
+
+    def get_input_details(self):
+        return [{'index': 0, 'shape': np.array([PATCH_SAMPLES])}]
+
+    def get_output_details(self):
+        return [{'index': 1, 'quantization': (0.0, 0)}]
+
+    def set_tensor(self, index, value):
+        self.tensors[index] = np.array(value)
+
+    def invoke(self):
+        # 'Bark' scores the patch peak, 'Speech' scores nothing
+        peak = float(np.abs(self.tensors[0]).max())
+        self.tensors[1] = np.array([[peak, 0.0]], dtype=np.float32)
+
+    def get_tensor(self, index):
+        return self.tensors[index]
+
+
+@pytest.fixture
+def detector_module(monkeypatch):
+    """Import dog_bark_detector.detector afresh with TensorFlow unavailable."""
+    monkeypatch.setitem(sys.modules, 'tensorflow', None)
+    monkeypatch.setitem(sys.modules, 'tensorflow_hub', None)
+    for name in ('dog_bark_detector.detector', 'dog_bark_detector.backends'):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    return importlib.import_module('dog_bark_detector.detector')
+
+
+@pytest.fixture
+def class_map(tmp_path):
+    """Write a two-class YAMNet style class map."""
+    path = tmp_path / 'class_map.csv'
+    path.write_text('index,mid,display_name\n0,/m/05tny_,Bark\n1,/m/09x0r,Speech\n')
+    return str(path)
+
+
+@pytest.mark.unit
+def test_detector_imports_without_tensorflow(detector_module):
+    """The detector module must not import TensorFlow at import time."""
+    assert sys.modules['tensorflow'] is None
+    assert 'tflite' in detector_module.DogBarkDetector.BACKENDS
+
+
+@pytest.mark.unit
+def test_tflite_backend_runs_without_tensorflow(detector_module, class_map,
+                                                monkeypatch):
+    """--backend tflite runs on the standalone interpreter alone."""
+    monkeypatch.setattr(detector_module.backends, 'Interpreter', FakeInterpreter)
+
+    detector = detector_module.DogBarkDetector(
+        confidence_threshold=0.5, backend='tflite',
+        model_path='yamnet.tflite', class_map_path=class_map)
+
+    # Loud audio only in the second half of a 3 s waveform
+    waveform = np.zeros(48000, dtype=np.float32)
+    waveform[24000:] = 0.9
+
+    detections = detector.detect_in_waveform(waveform)
+
+    assert detector.dog_class_indices == [0]
+    assert len(detections) > 0
+    assert np.all(detections.class_indices == 0)
+    # Every detected frame reaches into the loud half
+    assert np.all(detections.ends > 1.5)
+    assert np.allclose(detections.confidences, 0.9)
+
+
+@pytest.mark.unit
+def test_batch_layout(detector_module):
+    """Waveforms sit on the hop grid with their frames split back out."""
+    total, offsets, ranges = detector_module.DogBarkDetector._batch_layout([100, 15601])
+
+    # 100 samples: 1 frame, padded to 15600 then to the hop grid (3 hops)
+    # 15601 samples: 2 frames, 23280 samples padded to 4 hops
+    assert offsets == [0, 3 * PATCH_HOP_SAMPLES]
+    assert ranges == [(0, 1), (3, 5)]
+    assert total == 7 * PATCH_HOP_SAMPLES
+
+
+@pytest.mark.unit
+def test_batch_layout_matches_framing(detector_module):
+    """Each waveform gets as many frames as when framed alone, and no overlap."""
+    lengths = [0, 100, 15600, 15601, 23280, 23281, 48000]
+    total, offsets, ranges = detector_module.DogBarkDetector._batch_layout(lengths)
+
+    for length, offset, (start, end) in zip(lengths, offsets, ranges):
+        num_frames = len(detector_module.backends.frame_waveform(np.zeros(length)))
+        assert offset % PATCH_HOP_SAMPLES == 0
+        assert start == offset // PATCH_HOP_SAMPLES
+        assert end - start == num_frames
+
+    # The last frame of each waveform ends before the next waveform starts
+    for (start, end), next_offset in zip(ranges, offsets[1:] + [total]):
+        assert (end - 1) * PATCH_HOP_SAMPLES + PATCH_SAMPLES <= next_offset
+
+
+@pytest.mark.unit
+def test_batch_matches_single_calls(detector_module, class_map, monkeypatch):
+    """detect_in_waveform_batch returns what separate calls would."""
+    monkeypatch.setattr(detector_module.backends, 'Interpreter', FakeInterpreter)
+
+    detector = detector_module.DogBarkDetector(
+        confidence_threshold=0.5, backend='tflite',
+        model_path='yamnet.tflite', class_map_path=class_map)
+
+    rng = np.random.default_rng(0)
+    waveforms = [rng.uniform(-1, 1, length).astype(np.float32)
+                 for length in (100, 15601, 40000, 3 * PATCH_HOP_SAMPLES)]
+    chunk_offsets = [0.0, 8.0, 16.0, 24.0]
+    overlaps = [0.0, 0.25, 0.5, 0.25]
+
+    batched = detector.detect_in_waveform_batch(
+        waveforms, chunk_offsets=chunk_offsets, overlaps=overlaps)
+
+    assert len(batched) == len(waveforms)
+    for waveform, chunk_offset, overlap, detections in zip(
+            waveforms, chunk_offsets, overlaps, batched):
+        single = detector.detect_in_waveform(
+            waveform, chunk_offset=chunk_offset, overlap=overlap)
+        assert len(single) > 0
+        assert np.array_equal(detections.starts, single.starts)
+        assert np.array_equal(detections.ends, single.ends)
+        assert np.array_equal(detections.confidences, single.confidences)
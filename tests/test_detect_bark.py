@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the detect_bark.py command line helpers (no TensorFlow required).
+"""
+
+import numpy as np
+import pytest
+
+from detect_bark import drop_overlap_duplicates
+from dog_bark_detector import DogBarkDetector
+
+
+def make_detections(starts, confidence):
+    """Build a structured detection array with one frame per start time."""
+    detections = np.zeros(len(starts), dtype=DogBarkDetector.DETECTION_DTYPE)
+    detections['start_time'] = starts
+    detections['end_time'] = np.asarray(starts) + 0.96
+    detections['confidence'] = confidence
+    return detections
+
+
+@pytest.mark.unit
+def test_overlapped_frames_are_kept_once():
+    """A frame seen by two chunks is kept by the chunk owning its midpoint half."""
+    # 10s chunks with 2s overlap: chunks 0-10 and 8-18 share 8-10, split at 9
+    chunks = [make_detections([1.0, 8.5, 9.5], confidence=0.1),
+              make_detections([8.5, 9.5, 12.0], confidence=0.2)]
+
+    kept = drop_overlap_duplicates(chunks, [0.0, 8.0], overlap=2.0)
+
+    assert kept['start_time'].tolist() == [1.0, 8.5, 9.5, 12.0]
+    assert kept['confidence'].tolist() == [0.1, 0.1, 0.2, 0.2]
+
+
+@pytest.mark.unit
+def test_midpoint_belongs_to_later_chunk():
+    """Ownership ranges are half-open, so the midpoint itself is kept once."""
+    chunks = [make_detections([9.0], confidence=0.1),
+              make_detections([9.0], confidence=0.2)]
+
+    kept = drop_overlap_duplicates(chunks, [0.0, 8.0], overlap=2.0)
+
+    assert kept['confidence'].tolist() == [0.2]
+
+
+@pytest.mark.unit
+def test_first_and_last_chunks_keep_their_edges():
+    """Frames before the first overlap and after the last are never dropped."""
+    chunks = [make_detections([0.0, 0.5], confidence=0.1),
+              make_detections([17.5, 30.0], confidence=0.2)]
+
+    kept = drop_overlap_duplicates(chunks, [0.0, 8.0], overlap=2.0)
+
+    assert kept['start_time'].tolist() == [0.0, 0.5, 17.5, 30.0]
+
+
+@pytest.mark.unit
+def test_every_frame_kept_exactly_once():
+    """Frames on a shared time grid survive once however the chunks overlap."""
+    chunk_duration, overlap = 10.0, 2.0
+    chunk_starts = [0.0, 8.0, 16.0, 24.0]
+    grid = np.arange(0.0, 34.0, 0.24)
+
+    chunks = []
+    for start in chunk_starts:
+        inside = grid[(grid >= start) & (grid < start + chunk_duration)]
+        chunks.append(make_detections(inside, confidence=0.5))
+
+    kept = drop_overlap_duplicates(chunks, chunk_starts, overlap)
+
+    assert np.array_equal(np.sort(kept['start_time']), grid)
+
+
+@pytest.mark.unit
+def test_no_chunks():
+    """No chunks give an empty array of the detection dtype."""
+    kept = drop_overlap_duplicates([], [], overlap=2.0)
+
+    assert len(kept) == 0
+    assert kept.dtype == DogBarkDetector.DETECTION_DTYPE
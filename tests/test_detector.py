@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for hub class map loading and its disk cache (no TensorFlow required).
+
+A stand-in tensorflow module provides tf.io.gfile and the hub module is
+replaced by an object exposing class_map_path().
+"""
+
+import json
+import sys
+import types
+
+import pytest
+
+from dog_bark_detector import detector as detector_module
+
+
+class FakeTensor:
+    """Minimal eager tensor holding a bytes value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def numpy(self):
+        return self.value
+
+
+class FakeHubModule:
+    """Hub module whose class_map_path() points at a local CSV file."""
+
+    def __init__(self, class_map_path):
+        self.path = class_map_path
+
+    def class_map_path(self):
+        return FakeTensor(self.path.encode('utf-8'))
+
+
+@pytest.fixture
+def hub_class_map(tmp_path, monkeypatch):
+    """Serve a three-class map through a fake hub module and tf.io.gfile."""
+    path = tmp_path / 'yamnet_class_map.csv'
+    path.write_text('index,mid,display_name\n'
+                    '0,/m/09x0r,Speech\n1,/m/05tny_,Bark\n2,/m/0ytgt,"Dog, howl"\n')
+
+    fake_tf = types.SimpleNamespace(
+        io=types.SimpleNamespace(gfile=types.SimpleNamespace(GFile=open)))
+    monkeypatch.setitem(sys.modules, 'tensorflow', fake_tf)
+    monkeypatch.setattr(detector_module, '_get_cached_yamnet',
+                        lambda model_url: FakeHubModule(str(path)))
+    return path
+
+
+@pytest.mark.unit
+def test_read_hub_class_map_reads_the_file(hub_class_map):
+    """The class map path is opened and parsed, not parsed as CSV itself."""
+    class_names = detector_module._read_hub_class_map('https://example.com/yamnet')
+
+    assert class_names == ('Speech', 'Bark', 'Dog, howl')
+
+
+@pytest.fixture
+def class_cache(tmp_path, monkeypatch, hub_class_map):
+    """Point the class cache at an empty directory and clear the memo."""
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(detector_module, 'CLASS_CACHE_DIR', str(cache_dir))
+    detector_module._get_class_info.cache_clear()
+    yield cache_dir
+    detector_module._get_class_info.cache_clear()
+
+
+def get_class_info():
+    """Look up class info with the detector's dog class pattern."""
+    return detector_module._get_class_info(
+        'https://example.com/yamnet', detector_module.DogBarkDetector._DOG_RE)
+
+
+@pytest.mark.unit
+def test_class_info_cache_is_json(class_cache, hub_class_map):
+    """The first lookup writes a JSON cache that later lookups read back."""
+    class_info = get_class_info()
+
+    assert class_info == (('Speech', 'Bark', 'Dog, howl'), (1, 2))
+    [cache_file] = class_cache.iterdir()
+    assert cache_file.suffix == '.json'
+    assert json.loads(cache_file.read_text()) == {
+        'class_names': ['Speech', 'Bark', 'Dog, howl'], 'dog_class_indices': [1, 2]}
+
+    # A cold process reads the cache without touching the class map
+    hub_class_map.unlink()
+    detector_module._get_class_info.cache_clear()
+    assert get_class_info() == class_info
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('content', [
+    b'\x80\x04\x95 pickled data',
+    b'["Speech", "Bark"]',
+    b'{"class_names": ["Speech"], "dog_class_indices": [3]}',
+    b'{"class_names": [1, 2], "dog_class_indices": []}',
+    b'{"class_names": ["Speech"]}',
+])
+def test_invalid_class_info_cache_is_rebuilt(class_cache, content):
+    """A cache file that is not a valid class list is replaced."""
+    get_class_info()
+    [cache_file] = class_cache.iterdir()
+    cache_file.write_bytes(content)
+    detector_module._get_class_info.cache_clear()
+
+    assert get_class_info() == (('Speech', 'Bark', 'Dog, howl'), (1, 2))
+    assert json.loads(cache_file.read_text())['dog_class_indices'] == [1, 2]
@@ -3,15 +3,25 @@
 Test script for Google Drive downloader with the provided URL.
 """
 
+import functools
 import sys
 import os
+import pathlib
 
-# Add parent directory to path (go up one level from tests/)
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# When run as a script, add the repository root to the path so the tests
+# package can be imported (importing it as a package already does this)
+if not __package__:
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 
 from dog_bark_detector import GDriveDownloader
 
 
+@functools.lru_cache(maxsize=None)
+def _gdrive():
+    """Return the downloader shared by all tests (one session per run)."""
+    return GDriveDownloader()
+
+
 def test_url_parsing():
     """Test if the URL pattern matching works."""
     print("=" * 80)
@@ -21,7 +31,7 @@ def test_url_parsing():
     # The URL provided by the user
     test_url = "https://drive.google.com/file/d/1Jg8n-5iB4d0gGToptRu1ddbtsqzqCgJd/view?usp=drive_link"
 
-    gdrive = GDriveDownloader()
+    gdrive = _gdrive()
 
     print(f"\nTest URL: {test_url}")
     print("-" * 80)
@@ -34,7 +44,7 @@ def test_url_parsing():
         print("✓ URL recognized as Google Drive link")
     else:
         print("✗ URL NOT recognized as Google Drive link")
-        return False
+        raise AssertionError("URL not recognized as a Google Drive link")
 
     # Test file ID extraction
     file_id = gdrive.extract_file_id(test_url)
@@ -45,15 +55,14 @@ def test_url_parsing():
         expected_id = "1Jg8n-5iB4d0gGToptRu1ddbtsqzqCgJd"
         if file_id == expected_id:
             print(f"✓ File ID matches expected: {expected_id}")
-            return True
         else:
             print(f"✗ File ID mismatch!")
             print(f"  Expected: {expected_id}")
             print(f"  Got:      {file_id}")
-            return False
+            raise AssertionError(f"Expected file ID {expected_id}, got {file_id}")
     else:
         print("✗ Failed to extract file ID")
-        return False
+        raise AssertionError("Failed to extract file ID")
 
 
 def test_other_url_formats():
@@ -90,7 +99,7 @@ def test_other_url_formats():
         },
     ]
 
-    gdrive = GDriveDownloader()
+    gdrive = _gdrive()
     all_passed = True
 
     for i, test_case in enumerate(test_cases, 1):
@@ -107,7 +116,7 @@ def test_other_url_formats():
             print(f"  Got:      {file_id}")
             all_passed = False
 
-    return all_passed
+    assert all_passed, "some URL formats were not parsed correctly"
 
 
 def test_download_attempt():
@@ -122,7 +131,7 @@ def test_download_attempt():
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    gdrive = GDriveDownloader()
+    gdrive = _gdrive()
 
     print(f"\nAttempting to download from Google Drive...")
     print(f"URL: {test_url}")
@@ -145,12 +154,12 @@ def test_download_attempt():
                 print(f"  File type: Audio file ({file_ext})")
             else:
                 print(f"  File type: {file_ext if file_ext else 'Unknown'}")
-
-            return True
         else:
             print(f"\n✗ Download failed - file not found at: {file_path}")
-            return False
+            raise AssertionError(f"Downloaded file not found at {file_path}")
 
+    except AssertionError:
+        raise
     except Exception as e:
         print(f"\n✗ Download failed with error:")
         print(f"  {type(e).__name__}: {str(e)}")
@@ -164,7 +173,16 @@ def test_download_attempt():
         elif "404" in str(e) or "Not Found" in str(e):
             print("\n  The file may not exist or has been deleted")
 
+        raise AssertionError(f"Download failed: {e}") from e
+
+
+def _passed(test):
+    """Run a test function, returning whether it passed its assertions."""
+    try:
+        test()
+    except AssertionError:
         return False
+    return True
 
 
 def main():
@@ -177,18 +195,18 @@ def main():
 
     # Test 1: URL parsing
     print("\n")
-    results['url_parsing'] = test_url_parsing()
+    results['url_parsing'] = _passed(test_url_parsing)
 
     # Test 2: Various URL formats
     print("\n")
-    results['url_formats'] = test_other_url_formats()
+    results['url_formats'] = _passed(test_other_url_formats)
 
     # Test 3: Actual download (optional)
     print("\n")
     response = input("\nDo you want to attempt downloading the file? (y/n): ").lower()
 
     if response == 'y':
-        results['download'] = test_download_attempt()
+        results['download'] = _passed(test_download_attempt)
     else:
         print("\nSkipping download test.")
         results['download'] = None
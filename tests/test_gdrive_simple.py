@@ -3,84 +3,68 @@
 Simple test script for Google Drive URL parsing (no dependencies required).
 """
 
-import re
+import pathlib
+import sys
 
+# When run as a script, add the repository root to the path so the tests
+# package can be imported (importing it as a package already does this)
+if not __package__:
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 
-def test_url_extraction():
-    """Test URL pattern extraction for Google Drive."""
+# Importing the shared helpers only needs the standard library
+from tests._gdrive_common import extract_file_id
 
-    # Pattern from gdrive_downloader.py (updated)
-    DRIVE_URL_PATTERNS = [
-        r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
-        r'https://drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
-        r'[?&]id=([a-zA-Z0-9_-]+)',  # Match id= parameter (covers uc?id= and export=download&id=)
-    ]
 
-    def extract_file_id(url):
-        """Extract file ID from Google Drive URL."""
-        for pattern in DRIVE_URL_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+def _emit(lines):
+    """Write collected output lines with a single write."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-        # Check if it's already just a file ID
-        if re.match(r'^[a-zA-Z0-9_-]+$', url):
-            return url
 
-        return None
+def test_url_extraction():
+    """Test URL pattern extraction for Google Drive."""
+    out = []
 
-    print("=" * 80)
-    print("Testing Google Drive URL Pattern Extraction")
-    print("=" * 80)
+    out.append("=" * 80)
+    out.append("Testing Google Drive URL Pattern Extraction")
+    out.append("=" * 80)
 
     # The URL provided by the user
     test_url = "https://drive.google.com/file/d/1Jg8n-5iB4d0gGToptRu1ddbtsqzqCgJd/view?usp=drive_link"
     expected_id = "1Jg8n-5iB4d0gGToptRu1ddbtsqzqCgJd"
 
-    print(f"\nTest URL:")
-    print(f"  {test_url}")
-    print(f"\nExpected File ID:")
-    print(f"  {expected_id}")
-    print("\n" + "-" * 80)
+    out.append(f"\nTest URL:")
+    out.append(f"  {test_url}")
+    out.append(f"\nExpected File ID:")
+    out.append(f"  {expected_id}")
+    out.append("\n" + "-" * 80)
 
     # Test extraction
     extracted_id = extract_file_id(test_url)
 
-    print(f"\nExtracted File ID:")
-    print(f"  {extracted_id}")
-    print("\n" + "-" * 80)
+    out.append(f"\nExtracted File ID:")
+    out.append(f"  {extracted_id}")
+    out.append("\n" + "-" * 80)
 
     # Verify
     if extracted_id == expected_id:
-        print("\n✓ SUCCESS: File ID extraction working correctly!")
-        print(f"  Pattern matched and extracted: {extracted_id}")
-        return True
+        out.append("\n✓ SUCCESS: File ID extraction working correctly!")
+        out.append(f"  Pattern matched and extracted: {extracted_id}")
     else:
-        print("\n✗ FAILED: File ID mismatch!")
-        print(f"  Expected: {expected_id}")
-        print(f"  Got:      {extracted_id}")
-        return False
+        out.append("\n✗ FAILED: File ID mismatch!")
+        out.append(f"  Expected: {expected_id}")
+        out.append(f"  Got:      {extracted_id}")
+    _emit(out)
+
+    assert extracted_id == expected_id
 
 
 def test_multiple_formats():
     """Test various Google Drive URL formats."""
+    out = []
 
-    DRIVE_URL_PATTERNS = [
-        r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
-        r'https://drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
-        r'[?&]id=([a-zA-Z0-9_-]+)',  # Match id= parameter (covers uc?id= and export=download&id=)
-    ]
-
-    def extract_file_id(url):
-        for pattern in DRIVE_URL_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
-
-    print("\n\n" + "=" * 80)
-    print("Testing Multiple Google Drive URL Formats")
-    print("=" * 80)
+    out.append("\n\n" + "=" * 80)
+    out.append("Testing Multiple Google Drive URL Formats")
+    out.append("=" * 80)
 
     test_cases = [
         {
@@ -118,27 +102,37 @@ def test_multiple_formats():
     all_passed = True
 
     for i, test in enumerate(test_cases, 1):
-        print(f"\nTest {i}: {test['name']}")
-        print(f"  URL: {test['url']}")
+        out.append(f"\nTest {i}: {test['name']}")
+        out.append(f"  URL: {test['url']}")
 
         extracted = extract_file_id(test['url'])
 
         if extracted == test['expected']:
-            print(f"  ✓ PASS - Extracted: {extracted}")
+            out.append(f"  ✓ PASS - Extracted: {extracted}")
         else:
-            print(f"  ✗ FAIL")
-            print(f"    Expected: {test['expected']}")
-            print(f"    Got:      {extracted}")
+            out.append(f"  ✗ FAIL")
+            out.append(f"    Expected: {test['expected']}")
+            out.append(f"    Got:      {extracted}")
             all_passed = False
 
-    print("\n" + "=" * 80)
+    out.append("\n" + "=" * 80)
 
     if all_passed:
-        print("✓ All URL format tests PASSED!")
+        out.append("✓ All URL format tests PASSED!")
     else:
-        print("✗ Some URL format tests FAILED!")
+        out.append("✗ Some URL format tests FAILED!")
+
+    _emit(out)
+    assert all_passed, "some URL formats were not parsed correctly"
 
-    return all_passed
+
+def _passed(test):
+    """Run a test function, returning whether it passed its assertions."""
+    try:
+        test()
+    except AssertionError:
+        return False
+    return True
 
 
 def main():
@@ -149,10 +143,10 @@ def main():
     print("=" * 80)
 
     # Test 1: Main URL
-    result1 = test_url_extraction()
+    result1 = _passed(test_url_extraction)
 
     # Test 2: Multiple formats
-    result2 = test_multiple_formats()
+    result2 = _passed(test_multiple_formats)
 
     # Summary
     print("\n\n" + "=" * 80)
@@ -172,5 +166,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for detection merging (no TensorFlow required).
+
+The compiled merge kernel and its NumPy fallback are both compared with the
+original pure Python merge on random, touching and nested intervals.
+"""
+
+import importlib.util
+import sys
+
+import numpy as np
+import pytest
+
+from dog_bark_detector import _kernels
+from dog_bark_detector import detector as detector_module
+
+
+def baseline_merge(detections, merge_gap):
+    """The original list-of-dicts merge from DogBarkDetector.merge_detections."""
+    if not detections:
+        return []
+
+    sorted_detections = sorted(detections, key=lambda x: x['start_time'])
+
+    merged = []
+    current = sorted_detections[0].copy()
+
+    for detection in sorted_detections[1:]:
+        if detection['start_time'] - current['end_time'] <= merge_gap:
+            current['end_time'] = max(current['end_time'], detection['end_time'])
+            current['confidence'] = max(current['confidence'], detection['confidence'])
+        else:
+            merged.append(current)
+            current = detection.copy()
+
+    merged.append(current)
+    return merged
+
+
+def load_numpy_kernels(monkeypatch):
+    """Load a private copy of _kernels with numba unavailable."""
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    spec = importlib.util.spec_from_file_location('_kernels_numpy', _kernels.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.njit is None
+    return module
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def kernels(request, monkeypatch):
+    """The compiled kernels and the NumPy fallback."""
+    if request.param == 'numba':
+        if _kernels.njit is None:
+            pytest.skip("numba is not installed")
+        return _kernels
+    return load_numpy_kernels(monkeypatch)
+
+
+def random_detections(rng, count):
+    """
+    Random events on a 0.5 s grid, so gaps often equal the merge gap exactly.
+
+    Durations include zero-length events and long events that contain the
+    ones after them.
+    """
+    starts = rng.integers(0, 4 * count, count) * 0.5
+    durations = rng.choice([0.0, 0.5, 0.96, 1.0, 3.0, 10.0], count,
+                           p=[0.1, 0.2, 0.3, 0.2, 0.1, 0.1])
+    return [{'start_time': float(start), 'end_time': float(start + duration),
+             'confidence': float(rng.random()), 'class_index': int(rng.integers(0, 5))}
+            for start, duration in zip(starts, durations)]
+
+
+CASES = [
+    [],
+    # Touching: the second starts exactly merge_gap after the first ends
+    [{'start_time': 0.0, 'end_time': 1.0, 'confidence': 0.5, 'class_index': 0},
+     {'start_time': 2.0, 'end_time': 3.0, 'confidence': 0.7, 'class_index': 1}],
+    # Nested: a long event contains a later one that ends first
+    [{'start_time': 0.0, 'end_time': 10.0, 'confidence': 0.5, 'class_index': 0},
+     {'start_time': 2.0, 'end_time': 3.0, 'confidence': 0.9, 'class_index': 1},
+     {'start_time': 10.5, 'end_time': 11.0, 'confidence': 0.1, 'class_index': 2},
+     {'start_time': 13.0, 'end_time': 14.0, 'confidence': 0.2, 'class_index': 3}],
+    # Equal start times keep the first event's class
+    [{'start_time': 1.0, 'end_time': 2.0, 'confidence': 0.3, 'class_index': 4},
+     {'start_time': 1.0, 'end_time': 1.5, 'confidence': 0.8, 'class_index': 2}],
+] + [random_detections(np.random.default_rng(seed), count)
+     for seed, count in enumerate([1, 2, 5, 20, 100, 500])]
+
+
+def as_rows(detections):
+    """(start, end, confidence, class_index) tuples of dicts or a structured array."""
+    return [(d['start_time'], d['end_time'], d['confidence'], d['class_index'])
+            for d in detections]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('merge_gap', [0.0, 1.0])
+@pytest.mark.parametrize('detections', CASES)
+def test_merge_sorted_matches_baseline(kernels, detections, merge_gap):
+    """Both kernels group sorted events exactly as the Python loop does."""
+    ordered = sorted(detections, key=lambda d: d['start_time'])
+    starts = np.array([d['start_time'] for d in ordered], dtype=np.float64)
+    ends = np.array([d['end_time'] for d in ordered], dtype=np.float64)
+    confidences = np.array([d['confidence'] for d in ordered], dtype=np.float64)
+
+    group_starts, group_ends, group_confidences = kernels.merge_sorted(
+        starts, ends, confidences, merge_gap)
+
+    expected = baseline_merge(detections, merge_gap)
+    assert [ordered[i]['start_time'] for i in group_starts] == [
+        d['start_time'] for d in expected]
+    assert group_ends.tolist() == [d['end_time'] for d in expected]
+    assert group_confidences.tolist() == [d['confidence'] for d in expected]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('merge_gap', [0.0, 1.0])
+@pytest.mark.parametrize('detections', CASES)
+def test_merge_detections_vec_matches_baseline(kernels, detections, merge_gap,
+                                               monkeypatch):
+    """The structured-array merge returns the baseline events, unsorted input included."""
+    monkeypatch.setattr(detector_module, '_kernels', kernels)
+    DogBarkDetector = detector_module.DogBarkDetector
+    # merge_detections_vec needs no model state
+    detector = DogBarkDetector.__new__(DogBarkDetector)
+
+    array = np.zeros(len(detections), dtype=DogBarkDetector.DETECTION_DTYPE)
+    for row, detection in zip(array, detections):
+        row['start_time'] = detection['start_time']
+        row['end_time'] = detection['end_time']
+        row['confidence'] = detection['confidence']
+        row['class_index'] = detection['class_index']
+
+    merged = detector.merge_detections_vec(array, merge_gap=merge_gap)
+
+    assert as_rows(merged) == as_rows(baseline_merge(detections, merge_gap))
@@ -4,72 +4,15 @@ Test downloading from the actual Google Drive URL provided by user.
 """
 
 import os
+import pathlib
 import sys
 
-# Try to download using only standard library + requests
-try:
-    import requests
-    from tqdm import tqdm
-except ImportError:
-    print("Installing required packages...")
-    os.system("pip install -q requests tqdm")
-    import requests
-    from tqdm import tqdm
+# When run as a script, add the repository root to the path so the tests
+# package can be imported (importing it as a package already does this)
+if not __package__:
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
 
-import re
-
-
-def download_gdrive_file(url, output_path):
-    """Download file from Google Drive."""
-
-    # Extract file ID
-    pattern = r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)'
-    match = re.search(pattern, url)
-
-    if not match:
-        raise ValueError("Could not extract file ID from URL")
-
-    file_id = match.group(1)
-    print(f"File ID: {file_id}")
-
-    # Download URL
-    download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-
-    session = requests.Session()
-    response = session.get(download_url, stream=True)
-
-    # Check for virus scan warning
-    if 'download_warning' in response.text or 'virus scan' in response.text.lower():
-        # Look for confirmation token
-        for key, value in response.cookies.items():
-            if key.startswith('download_warning'):
-                download_url = f"https://drive.google.com/uc?export=download&confirm={value}&id={file_id}"
-                response = session.get(download_url, stream=True)
-                break
-
-    # Get file size
-    total_size = int(response.headers.get('content-length', 0))
-
-    # Create directory
-    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-
-    # Download
-    print(f"Downloading to: {output_path}")
-    print(f"File size: {total_size:,} bytes ({total_size/1024/1024:.2f} MB)")
-
-    with open(output_path, 'wb') as f:
-        if total_size > 0:
-            with tqdm(total=total_size, unit='B', unit_scale=True) as pbar:
-                for chunk in response.iter_content(chunk_size=32768):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-        else:
-            for chunk in response.iter_content(chunk_size=32768):
-                if chunk:
-                    f.write(chunk)
-
-    return output_path
+from tests._gdrive_common import detect_audio_type, download
 
 
 def main():
@@ -86,7 +29,7 @@ def main():
     print(f"Output: {output_path}\n")
 
     try:
-        file_path = download_gdrive_file(url, output_path)
+        file_path, header = download(url, output_path)
 
         if os.path.exists(file_path):
             file_size = os.path.getsize(file_path)
@@ -94,22 +37,10 @@ def main():
             print(f"  File: {file_path}")
             print(f"  Size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
 
-            # Try to detect file type
-            with open(file_path, 'rb') as f:
-                header = f.read(12)
-
-            if header[:4] == b'ID3\x03' or header[:4] == b'ID3\x04':
-                print(f"  Type: MP3 (ID3 tag detected)")
-            elif header[:4] == b'RIFF' and header[8:12] == b'WAVE':
-                print(f"  Type: WAV")
-            elif header[:4] == b'fLaC':
-                print(f"  Type: FLAC")
-            elif header[:4] == b'OggS':
-                print(f"  Type: OGG")
-            elif header[4:8] == b'ftyp':
-                print(f"  Type: M4A/MP4")
-            elif header[:2] == b'\xff\xfb' or header[:2] == b'\xff\xf3' or header[:2] == b'\xff\xf2':
-                print(f"  Type: MP3")
+            # Try to detect file type from the header kept during the download
+            file_type = detect_audio_type(header)
+            if file_type:
+                print(f"  Type: {file_type}")
             else:
                 print(f"  Type: Unknown (header: {header[:12].hex()})")
 